@@ -34,6 +34,8 @@ POSITIVE_TAGS = ["Fun", "Amazing", "Immersive", "Story-rich", "Rewarding", "Addi
 
 # Combined list for backward compatibility
 RATING_TAGS = NEGATIVE_TAGS + NEUTRAL_TAGS + POSITIVE_TAGS
+# Position of each tag in RATING_TAGS, used in the -TAG-n- checkbox keys
+RATING_TAG_INDEX = {tag: i for i, tag in enumerate(RATING_TAGS)}
 
 # Table styling
 COMPLETED_STYLE = ('#000000', '#dff0d8')  # Light green background, black text
@@ -6,6 +6,13 @@ Handles loading, saving, and converting game data files.
 import json
 import os
 import openpyxl
+
+try:
+    import orjson  # Optional: parses .gmd files several times faster than json
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from datetime import datetime, timedelta
 from utilities import format_timedelta_with_seconds
 from config import load_config, save_config
@@ -49,13 +56,15 @@ def save_to_gmd(data, filename):
         games_data.append(game)
     
     try:
+        # Encode first and write once; json.dump issues a write per JSON token
+        contents = json.dumps({
+            'games': games_data, 
+            'last_modified': datetime.now().isoformat(),
+            'feedback_format_version': 'unified',  # Flag to indicate unified feedback format
+            'pause_format_version': 'integrated'   # Flag to indicate integrated pause format
+        }, indent=2)
         with open(filename, 'w') as f:
-            json.dump({
-                'games': games_data, 
-                'last_modified': datetime.now().isoformat(),
-                'feedback_format_version': 'unified',  # Flag to indicate unified feedback format
-                'pause_format_version': 'integrated'   # Flag to indicate integrated pause format
-            }, f, indent=2)
+            f.write(contents)
         print(f"Successfully saved {len(games_data)} games to {filename}")
         return True
     except Exception as e:
@@ -65,9 +74,11 @@ def save_to_gmd(data, filename):
 def load_from_gmd(filename):
     """Load game data from a .gmd file and return (data, needs_migration)"""
     try:
-        with open(filename, 'r') as f:
-            data = json.load(f)
-            games = data.get('games', [])
+        # Read the whole file in one call and parse it from memory
+        with open(filename, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+        games = data.get('games', [])
             
         # Check if this file needs migration for feedback format or pause format
         feedback_format_version = data.get('feedback_format_version', 'legacy')
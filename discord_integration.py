@@ -44,6 +44,7 @@ class DiscordIntegration:
         self.showing_completion = False  # Flag to prevent overriding completion status
         self.current_tab = "Games List"  # Track current tab for timer return
         self.selected_game_stats = None  # Track selected game in statistics tab
+        self.browsing_presence = None  # (tab, total games, completed games) last sent as browsing presence
         
         # Initialize connection if enabled
         if self.enabled:
@@ -55,6 +56,7 @@ class DiscordIntegration:
             return False
             
         try:
+            self.browsing_presence = None  # A new connection starts without any presence
             self.rpc = Presence(self.CLIENT_ID)
             self.rpc.connect()
             self.connected = True
@@ -115,6 +117,11 @@ class DiscordIntegration:
             # Update current tab tracking
             self.current_tab = current_tab
             
+            # Skip the IPC round trip when Discord already shows this exact browsing presence
+            presence = (current_tab, self.total_games, self.completed_games)
+            if self.current_state == "browsing" and presence == self.browsing_presence:
+                return
+            
             # Debug: print tab information
             print(f"Discord: Updating presence for tab '{current_tab}' with {self.total_games} games, {self.completed_games} completed")
             
@@ -152,6 +159,7 @@ class DiscordIntegration:
                 ]
             )
             self.current_state = "browsing"
+            self.browsing_presence = presence
             
         except Exception as e:
             print(f"Error updating Discord presence (browsing): {str(e)}")
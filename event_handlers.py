@@ -9,29 +9,43 @@ import io
 import time
 import tempfile
 import traceback
+from collections import namedtuple
 import PySimpleGUI as sg
 import matplotlib.pyplot as plt
-from datetime import datetime, timedelta
+from datetime import datetime, date, timedelta
 
 from constants import QT_ENTER_KEY1, QT_ENTER_KEY2, STAR_FILLED, STAR_EMPTY, VERSION
 from config import load_config, save_config
 from data_management import load_from_gmd, save_to_gmd, convert_excel_to_gmd, save_data
 from ui_components import (
     create_entry_popup, validate_entry_form, show_game_actions_dialog,
-    update_table_display, get_display_row_with_rating
+    update_table_display, update_table_row, get_display_row_with_rating
 )
 from session_management import (
     show_popup, extract_all_sessions, calculate_session_statistics,
-    get_game_sessions, format_session_for_display, get_status_history,
+    get_game_sessions, format_session_for_display,
+    find_game_row, get_row_sessions, get_row_status_history,
     format_status_history_for_display, display_all_game_notes, show_session_feedback_popup,
-    migrate_all_game_sessions, create_github_contributions_canvas, setup_contributions_tooltip_callback
+    migrate_all_game_sessions, create_github_contributions_canvas, setup_contributions_tooltip_callback,
+    create_session_timeline_chart, create_session_distribution_chart, create_session_heatmap,
+    create_status_timeline_chart, show_manual_session_popup, add_manual_session_to_game
 )
-from visualizations import update_summary_charts
+from visualizations import RENDER_LOCK
 from game_statistics import update_summary
-from utilities import safe_sort_by_date, safe_sort_by_time, calculate_popup_center_location
+from utilities import (
+    safe_sort_by_date, safe_sort_by_time, sort_by_column, calculate_popup_center_location, get_session_row_colors,
+    format_timedelta_with_seconds, parse_session_duration
+)
 from ratings import show_rating_popup, get_session_rating_summary, format_rating
-from help_dialogs import show_user_guide, show_data_format_info, show_troubleshooting_guide, show_feature_tour, show_release_notes, show_bug_report_info, show_about_dialog
 from discord_integration import get_discord_integration
+from update_ui import check_for_updates_manual, show_update_settings
+from auto_updater import get_updater
+from date_activity_view import show_date_picker_dialog, show_date_activity_view
+
+# What a table event produced: kind is 'sorted', 'status' or 'action' with the new data
+# list or the double-clicked row index as payload, or 'none' when nothing needs handling
+TableResult = namedtuple('TableResult', 'kind payload')
+NO_TABLE_RESULT = TableResult('none', None)
 
 def record_status_change(game_data, old_status, new_status):
     """Record a status change with timestamp"""
@@ -52,27 +66,47 @@ def record_status_change(game_data, old_status, new_status):
     game_data[8].append(status_change)
     return status_change
 
-def update_statistics_tab(window, data, selected_game=None, update_game_list=True, contributions_year=None, 
-                          heatmap_window_months=1, heatmap_end_date=None, distribution_chart_type='line', full_dataset=None):
+def update_statistics_tab(window, data, selected_game=None, update_game_list=True, contributions_year=None,
+                          heatmap_window_months=1, heatmap_end_date=None, distribution_chart_type='line', full_dataset=None,
+                          all_sessions=None, game_sessions=None, game_names=None, session_rating_summary=None):
     """Update all elements in the Statistics tab"""
+    statistics = compute_statistics_tab(data, selected_game, update_game_list, contributions_year,
+                                        heatmap_window_months, heatmap_end_date, distribution_chart_type, full_dataset,
+                                        all_sessions, game_sessions, game_names, session_rating_summary)
+    apply_statistics_tab(window, statistics)
+
+def get_statistics_game_names(game_list_data):
+    """Get the sorted names of games with sessions, status history or a game-level rating for the Statistics game list"""
+    game_names = []
+    for idx, game_data in game_list_data:
+        game_name = game_data[0]
+        has_sessions = len(game_data) > 7 and bool(game_data[7])
+        has_status_history = len(game_data) > 8 and bool(game_data[8])
+        has_game_rating = len(game_data) > 9 and game_data[9] and isinstance(game_data[9], dict)
+
+        # Include the game if it has sessions, status history, OR a game-level rating
+        if has_sessions or has_status_history or has_game_rating:
+            game_names.append(game_name)
+    return sorted(game_names)
+
+def compute_statistics_tab(data, selected_game=None, update_game_list=True, contributions_year=None,
+                           heatmap_window_months=1, heatmap_end_date=None, distribution_chart_type='line', full_dataset=None,
+                           all_sessions=None, game_sessions=None, game_names=None, session_rating_summary=None):
+    """Calculate everything the Statistics tab shows without touching the window.
+
+    Safe to run on a worker thread; pass the result to apply_statistics_tab on the UI thread.
+    all_sessions, game_sessions, game_names and session_rating_summary may be passed in when the caller
+    already has them for data; a session_rating_summary of None is worked out again.
+    """
+    statistics = {'selected_game': selected_game, 'game_names': None}
+
     # Extract all sessions
-    all_sessions = extract_all_sessions(data)
-    
+    if all_sessions is None:
+        all_sessions = extract_all_sessions(data)
+
     # Calculate overall statistics
-    stats = calculate_session_statistics(all_sessions)
-    
-    # Update overall statistics display
-    window['-TOTAL-SESSIONS-'].update(f"Total Sessions: {stats['total_count']}")
-    from utilities import format_timedelta_with_seconds
-    window['-TOTAL-SESSION-TIME-'].update(f"Total Session Time: {format_timedelta_with_seconds(stats['total_time'])}")
-    window['-AVG-SESSION-'].update(f"Average Session Length: {format_timedelta_with_seconds(stats['avg_length'])}")
-    
-    most_active = stats['most_active_day']
-    if most_active['day']:
-        window['-MOST-ACTIVE-DAY-'].update(f"Most Active Day: {most_active['day'].strftime('%Y-%m-%d')} ({most_active['count']} sessions)")
-    else:
-        window['-MOST-ACTIVE-DAY-'].update("Most Active Day: None")
-    
+    statistics['stats'] = calculate_session_statistics(all_sessions)
+
     # Update heatmap period display
     if heatmap_end_date:
         start_date = heatmap_end_date - timedelta(days=heatmap_window_months * 30)
@@ -81,84 +115,193 @@ def update_statistics_tab(window, data, selected_game=None, update_game_list=Tru
         # Default display for most recent period
         window_names = {1: '1 Month', 3: '3 Months', 6: '6 Months', 12: '1 Year'}
         period_text = f"Recent {window_names.get(heatmap_window_months, f'{heatmap_window_months} Months')}"
-    
-    window['-HEATMAP-PERIOD-DISPLAY-'].update(period_text)
-    
+
+    statistics['period_text'] = period_text
+
     # Only update game list when explicitly requested (not during selection)
     if update_game_list:
-        # Use full dataset for game list population to show all games even when filtering is active
-        game_list_data = full_dataset if full_dataset is not None else data
-        
-        # Get unique game names for the game list - include games with sessions, status history, OR game-level ratings
-        game_names = []
-        for idx, game_data in game_list_data:
-            game_name = game_data[0]
-            has_sessions = len(game_data) > 7 and game_data[7] and len(game_data[7]) > 0
-            has_status_history = len(game_data) > 8 and game_data[8] and len(game_data[8]) > 0
-            has_game_rating = len(game_data) > 9 and game_data[9] and isinstance(game_data[9], dict)
-            
-            # Include the game if it has sessions, status history, OR a game-level rating
-            if has_sessions or has_status_history or has_game_rating:
-                game_names.append(game_name)
-        
-        # Update game list
-        window['-GAME-LIST-'].update(values=sorted(game_names))
-    
+        if game_names is None:
+            # Use full dataset for game list population to show all games even when filtering is active
+            game_names = get_statistics_game_names(full_dataset if full_dataset is not None else data)
+        statistics['game_names'] = game_names
+
     # If a game is selected, update its specific statistics
     if selected_game:
-        # Update Discord presence for viewing stats
-        discord = get_discord_integration()
-        discord.update_presence_viewing_stats(selected_game)
-        
+        # Find the game's row once for its sessions, status history and rating
+        game_row = find_game_row(data, selected_game)
+
         # Get sessions for the selected game
-        game_sessions = get_game_sessions(data, selected_game)
-        
+        if game_sessions is None:
+            game_sessions = get_row_sessions(game_row)
+
         # Get status history for the selected game
-        status_history = get_status_history(data, selected_game)
-        
+        status_history = get_row_status_history(game_row)
+
         # Calculate game-specific stats
-        game_session_count = len(game_sessions)
         game_session_time = timedelta()
-        
+
         for session in game_sessions:
             try:
                 duration = session.get('duration', '00:00:00')
                 if isinstance(duration, str):
-                    parts = duration.split(':')
-                    if len(parts) == 3:
-                        h, m, s = map(int, parts)
-                        game_session_time += timedelta(hours=h, minutes=m, seconds=s)
+                    duration_seconds = parse_session_duration(duration)
+                    if duration_seconds is not None:
+                        game_session_time += timedelta(seconds=duration_seconds)
             except:
                 continue
-        
-        # Update game-specific display
-        window['-SELECTED-GAME-'].update(f"Sessions for: {selected_game}")
-        window['-GAME-SESSIONS-'].update(f"Sessions: {game_session_count}")
-        window['-GAME-SESSION-TIME-'].update(f"Total Time: {format_timedelta_with_seconds(game_session_time)}")
-        
-        # Update rating comparison widget
+
+        statistics['game_session_count'] = len(game_sessions)
+        statistics['game_session_time'] = game_session_time
+
         # Get auto-calculated rating from sessions
-        session_rating_summary = get_session_rating_summary(game_sessions)
-        
+        if session_rating_summary is None:
+            session_rating_summary = get_session_rating_summary(game_sessions)
+        statistics['session_rating_summary'] = session_rating_summary
+
         # Get manual game rating
         manual_rating = None
-        for idx, game_data in data:
-            if game_data[0] == selected_game:
-                if len(game_data) > 9 and game_data[9] and isinstance(game_data[9], dict):
-                    manual_rating = game_data[9]
-                break
-        
+        if game_row is not None and len(game_row) > 9 and game_row[9] and isinstance(game_row[9], dict):
+            manual_rating = game_row[9]
+        statistics['manual_rating'] = manual_rating
+
+        # Update sessions table
+        display_data = format_session_for_display(game_sessions)
+
+        # Format the details column to ensure it fits well
+        if display_data:
+            for row in display_data:
+                # Don't truncate the text so aggressively - use more of the available width
+                if len(row) > 2 and len(row[2]) > 120:
+                    row[2] = row[2][:117] + '...'
+
+        # Set colors for rows with notes/ratings
+        statistics['sessions_table'] = display_data
+        statistics['sessions_row_colors'] = get_session_row_colors(display_data)
+
+        # Update status history table
+        statistics['status_history_table'] = format_status_history_for_display(status_history)
+
+        # Update visualizations for the selected game
+        # Create GitHub-style contributions canvas
+        try:
+            statistics['contributions'] = create_github_contributions_canvas(game_sessions, selected_game, year=contributions_year)
+        except Exception as e:
+            print(f"Error creating contributions canvas: {str(e)}")
+            traceback.print_exc()
+            statistics['contributions'] = None
+
+        # Create other charts (each chart builder holds RENDER_LOCK while it draws)
+        timeline_data = create_session_timeline_chart(game_sessions, selected_game)
+        distribution_data = create_session_distribution_chart(game_sessions, selected_game, distribution_chart_type)
+        heatmap_data = create_session_heatmap(game_sessions, selected_game, heatmap_window_months, heatmap_end_date)
+        status_timeline_data = create_status_timeline_chart(status_history, selected_game)
+    else:
+        # Create overall visualizations
+        # Create overall GitHub-style contributions canvas for all sessions
+        try:
+            statistics['contributions'] = create_github_contributions_canvas(all_sessions, year=contributions_year)
+        except Exception as e:
+            print(f"Error creating overall contributions canvas: {str(e)}")
+            traceback.print_exc()
+            statistics['contributions'] = None
+
+        # Create other charts (each chart builder holds RENDER_LOCK while it draws)
+        timeline_data = create_session_timeline_chart(all_sessions)
+        distribution_data = create_session_distribution_chart(all_sessions, None, distribution_chart_type)
+        heatmap_data = create_session_heatmap(all_sessions, None, heatmap_window_months, heatmap_end_date)
+
+        # For status timeline in overview mode, show placeholder (drawn with pyplot, so under the lock)
+        with RENDER_LOCK:
+            fig, ax = plt.subplots(figsize=(7, 3))
+            ax.text(0.5, 0.5, "Select a specific game to view status timeline",
+                    ha='center', va='center', fontsize=10)
+            ax.set_title("Status Change Timeline", fontsize=12)
+
+            # Save to a buffer
+            status_timeline_data = io.BytesIO()
+            fig.savefig(status_timeline_data, format='png')
+            status_timeline_data.seek(0)
+            plt.close(fig)
+
+    # Use temporary files for other charts with unique names to force refresh
+    temp_dir = tempfile.gettempdir()
+    timestamp = str(int(time.time() * 1000))  # Millisecond timestamp for uniqueness
+
+    timeline_file = os.path.join(temp_dir, f'timeline_temp_{timestamp}.png')
+    distribution_file = os.path.join(temp_dir, f'distribution_temp_{timestamp}.png')
+    heatmap_file = os.path.join(temp_dir, f'heatmap_temp_{timestamp}.png')
+    status_timeline_file = os.path.join(temp_dir, f'status_timeline_temp_{timestamp}.png')
+
+    with open(timeline_file, 'wb') as f:
+        f.write(timeline_data.getvalue())
+
+    with open(distribution_file, 'wb') as f:
+        f.write(distribution_data.getvalue())
+
+    with open(heatmap_file, 'wb') as f:
+        f.write(heatmap_data.getvalue())
+
+    with open(status_timeline_file, 'wb') as f:
+        f.write(status_timeline_data.getvalue())
+
+    print(f"Updated distribution chart file: {distribution_file}")
+
+    statistics['chart_files'] = {
+        '-SESSIONS-TIMELINE-': timeline_file,
+        '-SESSIONS-DISTRIBUTION-': distribution_file,
+        '-SESSIONS-HEATMAP-': heatmap_file,
+        '-STATUS-TIMELINE-': status_timeline_file
+    }
+
+    return statistics
+
+def apply_statistics_tab(window, statistics):
+    """Show the result of compute_statistics_tab in the Statistics tab (UI thread only)"""
+    stats = statistics['stats']
+    selected_game = statistics['selected_game']
+
+    # Update overall statistics display
+    window['-TOTAL-SESSIONS-'].update(f"Total Sessions: {stats['total_count']}")
+    window['-TOTAL-SESSION-TIME-'].update(f"Total Session Time: {format_timedelta_with_seconds(stats['total_time'])}")
+    window['-AVG-SESSION-'].update(f"Average Session Length: {format_timedelta_with_seconds(stats['avg_length'])}")
+
+    most_active = stats['most_active_day']
+    if most_active['day']:
+        window['-MOST-ACTIVE-DAY-'].update(f"Most Active Day: {most_active['day'].strftime('%Y-%m-%d')} ({most_active['count']} sessions)")
+    else:
+        window['-MOST-ACTIVE-DAY-'].update("Most Active Day: None")
+
+    window['-HEATMAP-PERIOD-DISPLAY-'].update(statistics['period_text'])
+
+    # Update game list
+    if statistics['game_names'] is not None:
+        window['-GAME-LIST-'].update(values=statistics['game_names'])
+
+    if selected_game:
+        # Update Discord presence for viewing stats
+        discord = get_discord_integration()
+        discord.update_presence_viewing_stats(selected_game)
+
+        # Update game-specific display
+        window['-SELECTED-GAME-'].update(f"Sessions for: {selected_game}")
+        window['-GAME-SESSIONS-'].update(f"Sessions: {statistics['game_session_count']}")
+        window['-GAME-SESSION-TIME-'].update(f"Total Time: {format_timedelta_with_seconds(statistics['game_session_time'])}")
+
+        # Update rating comparison widget
+        session_rating_summary = statistics['session_rating_summary']
+        manual_rating = statistics['manual_rating']
+
         # Update rating comparison display
         if session_rating_summary or manual_rating:
             window['-RATING-COMPARISON-'].update(visible=True)
-            
+
             # Update auto-calculated rating side
             if session_rating_summary:
                 auto_stars = session_rating_summary['average_stars']
                 auto_rating_display = STAR_FILLED * auto_stars + STAR_EMPTY * (5 - auto_stars)
                 window['-AUTO-RATING-STARS-'].update(auto_rating_display)
                 window['-AUTO-RATING-INFO-'].update(f"Avg: {session_rating_summary['exact_average']:.1f} ({session_rating_summary['total_rated_sessions']} sessions)")
-                
+
                 # Format common tags as comma-separated list
                 if session_rating_summary['most_common_tags']:
                     tags_text = ', '.join(session_rating_summary['most_common_tags'][:5])
@@ -169,27 +312,27 @@ def update_statistics_tab(window, data, selected_game=None, update_game_list=Tru
                 window['-AUTO-RATING-STARS-'].update("No session ratings")
                 window['-AUTO-RATING-INFO-'].update("")
                 window['-AUTO-RATING-TAGS-'].update("N/A")
-            
+
             # Update manual rating side
             if manual_rating:
                 manual_stars = manual_rating.get('stars', 0)
                 manual_rating_display = STAR_FILLED * manual_stars + STAR_EMPTY * (5 - manual_stars)
                 window['-MANUAL-RATING-STARS-'].update(manual_rating_display)
-                
+
                 rating_type = "Auto-calculated" if manual_rating.get('auto_calculated', False) else "Manual"
                 window['-MANUAL-RATING-INFO-'].update(rating_type)
-                
+
                 # Format manual rating tags separately from comment
                 manual_tags = manual_rating.get('tags', [])
                 manual_comment = manual_rating.get('comment', '').strip()
-                
+
                 # Update tags (centered, comma-separated)
                 if manual_tags:
                     tags_text = ', '.join(manual_tags[:5])
                 else:
                     tags_text = "No tags"
                 window['-MANUAL-RATING-TAGS-'].update(tags_text)
-                
+
                 # Update comment in separate area
                 if manual_comment:
                     # Show full comment text without truncation
@@ -203,175 +346,46 @@ def update_statistics_tab(window, data, selected_game=None, update_game_list=Tru
                 window['-MANUAL-RATING-COMMENT-'].update("N/A")
         else:
             window['-RATING-COMPARISON-'].update(visible=False)
-        
-        # Update sessions table
-        display_data = format_session_for_display(game_sessions)
-        
-        # Format the details column to ensure it fits well
-        if display_data:
-            for row in display_data:
-                # Don't truncate the text so aggressively - use more of the available width
-                if len(row) > 2 and len(row[2]) > 120:
-                    row[2] = row[2][:117] + '...'
-        
-        # Set colors for rows with notes/ratings
-        from utilities import get_session_row_colors
-        row_colors = get_session_row_colors(display_data)
-        window['-SESSIONS-TABLE-'].update(values=display_data, row_colors=row_colors)
-        
-        # Update status history table
-        status_display_data = format_status_history_for_display(status_history)
-        window['-STATUS-HISTORY-TABLE-'].update(values=status_display_data)
-        
-        # Update visualizations for the selected game
-        from session_management import (
-            create_session_timeline_chart, create_session_distribution_chart,
-            create_session_heatmap, create_status_timeline_chart,
-            create_github_contributions_canvas
-        )
-        
-        # Create GitHub-style contributions canvas
-        try:
-            contributions_data = create_github_contributions_canvas(game_sessions, selected_game, year=contributions_year)
-            if contributions_data and 'draw_function' in contributions_data:
-                # Set up tooltip callback
-                tooltip_callback = setup_contributions_tooltip_callback(window)
-                window['-CONTRIBUTIONS-CANVAS-']._tooltip_callback = tooltip_callback
-                
-                # Draw the heatmap on the fixed canvas
-                contributions_data['draw_function'](window['-CONTRIBUTIONS-CANVAS-'])
-        except Exception as e:
-            print(f"Error creating contributions canvas: {str(e)}")
-            traceback.print_exc()
-            # Draw error message on canvas
-            try:
-                canvas = window['-CONTRIBUTIONS-CANVAS-'].Widget
-                canvas.delete("all")
-                canvas.create_text(400, 150, text="Error loading contributions map", 
-                                 font=('Arial', 12, 'bold'), fill='red')
-            except:
-                pass
-        
-        # Create other charts
-        timeline_data = create_session_timeline_chart(game_sessions, selected_game)
-        distribution_data = create_session_distribution_chart(game_sessions, selected_game, distribution_chart_type)
-        heatmap_data = create_session_heatmap(game_sessions, selected_game, heatmap_window_months, heatmap_end_date)
-        status_timeline_data = create_status_timeline_chart(status_history, selected_game)
-        
-        # Use temporary files for other charts with unique names to force refresh
-        import tempfile
-        import time
-        temp_dir = tempfile.gettempdir()
-        timestamp = str(int(time.time() * 1000))  # Millisecond timestamp for uniqueness
-        
-        timeline_file = os.path.join(temp_dir, f'timeline_temp_{timestamp}.png')
-        distribution_file = os.path.join(temp_dir, f'distribution_temp_{timestamp}.png')
-        heatmap_file = os.path.join(temp_dir, f'heatmap_temp_{timestamp}.png')
-        status_timeline_file = os.path.join(temp_dir, f'status_timeline_temp_{timestamp}.png')
-        
-        with open(timeline_file, 'wb') as f:
-            f.write(timeline_data.getvalue())
-        
-        with open(distribution_file, 'wb') as f:
-            f.write(distribution_data.getvalue())
-            
-        with open(heatmap_file, 'wb') as f:
-            f.write(heatmap_data.getvalue())
-            
-        with open(status_timeline_file, 'wb') as f:
-            f.write(status_timeline_data.getvalue())
-        
-        print(f"Updated distribution chart file: {distribution_file}")
-        
-        window['-SESSIONS-TIMELINE-'].update(filename=timeline_file)
-        window['-SESSIONS-DISTRIBUTION-'].update(filename=distribution_file)
-        window['-SESSIONS-HEATMAP-'].update(filename=heatmap_file)
-        window['-STATUS-TIMELINE-'].update(filename=status_timeline_file)
+
+        window['-SESSIONS-TABLE-'].update(values=statistics['sessions_table'], row_colors=statistics['sessions_row_colors'])
+        window['-STATUS-HISTORY-TABLE-'].update(values=statistics['status_history_table'])
     else:
         # Show overall visualizations when no game is selected
         window['-SELECTED-GAME-'].update("No game selected")
         window['-GAME-SESSIONS-'].update("Sessions: 0")
         window['-GAME-SESSION-TIME-'].update("Total Time: 00:00:00")
-        
+
         # Hide rating comparison when no game is selected
         window['-RATING-COMPARISON-'].update(visible=False)
-        
+
         # Explicitly clear row colors by passing an empty list
         window['-SESSIONS-TABLE-'].update(values=[], row_colors=[])
         window['-STATUS-HISTORY-TABLE-'].update(values=[])
-        
-        # Create overall visualizations
-        from session_management import (
-            create_session_timeline_chart, create_session_distribution_chart, 
-            create_session_heatmap, create_github_contributions_canvas
-        )
-        
-        # Create overall GitHub-style contributions canvas for all sessions
+
+    # Draw the GitHub-style contributions map on the fixed canvas
+    try:
+        contributions_data = statistics['contributions']
+        if contributions_data is None:
+            raise ValueError("contributions map could not be created")
+        if 'draw_function' in contributions_data:
+            # Set up tooltip callback
+            tooltip_callback = setup_contributions_tooltip_callback(window)
+            window['-CONTRIBUTIONS-CANVAS-']._tooltip_callback = tooltip_callback
+
+            contributions_data['draw_function'](window['-CONTRIBUTIONS-CANVAS-'])
+    except Exception as e:
+        print(f"Error drawing contributions canvas: {str(e)}")
+        # Draw error message on canvas
         try:
-            contributions_data = create_github_contributions_canvas(all_sessions, year=contributions_year)
-            if contributions_data and 'draw_function' in contributions_data:
-                # Set up tooltip callback
-                tooltip_callback = setup_contributions_tooltip_callback(window)
-                window['-CONTRIBUTIONS-CANVAS-']._tooltip_callback = tooltip_callback
-                
-                # Draw the heatmap on the fixed canvas
-                contributions_data['draw_function'](window['-CONTRIBUTIONS-CANVAS-'])
-        except Exception as e:
-            print(f"Error creating overall contributions canvas: {str(e)}")
-            traceback.print_exc()
-            # Draw error message on canvas
-            try:
-                canvas = window['-CONTRIBUTIONS-CANVAS-'].Widget
-                canvas.delete("all")
-                canvas.create_text(400, 150, text="Error loading contributions map", 
-                                 font=('Arial', 12, 'bold'), fill='red')
-            except:
-                pass
-        
-        # Create other charts
-        timeline_data = create_session_timeline_chart(all_sessions)
-        distribution_data = create_session_distribution_chart(all_sessions, None, distribution_chart_type)
-        heatmap_data = create_session_heatmap(all_sessions, None, heatmap_window_months, heatmap_end_date)
-        
-        # For status timeline in overview mode, show placeholder
-        fig, ax = plt.subplots(figsize=(7, 3))
-        ax.text(0.5, 0.5, "Select a specific game to view status timeline", 
-                ha='center', va='center', fontsize=10)
-        ax.set_title("Status Change Timeline", fontsize=12)
-        
-        # Save to a buffer
-        status_timeline_buf = io.BytesIO()
-        fig.savefig(status_timeline_buf, format='png')
-        status_timeline_buf.seek(0)
-        plt.close(fig)
-        
-        # Use temporary files for other charts with unique names to force refresh
-        import tempfile
-        import time
-        temp_dir = tempfile.gettempdir()
-        timestamp = str(int(time.time() * 1000))  # Millisecond timestamp for uniqueness
-        
-        timeline_file = os.path.join(temp_dir, f'timeline_temp_{timestamp}.png')
-        distribution_file = os.path.join(temp_dir, f'distribution_temp_{timestamp}.png')
-        heatmap_file = os.path.join(temp_dir, f'heatmap_temp_{timestamp}.png')
-        status_timeline_file = os.path.join(temp_dir, f'status_timeline_temp_{timestamp}.png')
-        
-        with open(timeline_file, 'wb') as f:
-            f.write(timeline_data.getvalue())
-        
-        with open(distribution_file, 'wb') as f:
-            f.write(distribution_data.getvalue())
-            
-        with open(heatmap_file, 'wb') as f:
-            f.write(heatmap_data.getvalue())
-            
-        with open(status_timeline_file, 'wb') as f:
-            f.write(status_timeline_buf.getvalue())
-        
-        window['-SESSIONS-TIMELINE-'].update(filename=timeline_file)
-        window['-SESSIONS-DISTRIBUTION-'].update(filename=distribution_file)
-        window['-SESSIONS-HEATMAP-'].update(filename=heatmap_file)
-        window['-STATUS-TIMELINE-'].update(filename=status_timeline_file)
+            canvas = window['-CONTRIBUTIONS-CANVAS-'].Widget
+            canvas.delete("all")
+            canvas.create_text(400, 150, text="Error loading contributions map",
+                             font=('Arial', 12, 'bold'), fill='red')
+        except:
+            pass
+
+    for key, chart_file in statistics['chart_files'].items():
+        window[key].update(filename=chart_file)
 
 def update_window_title(window, file_path):
     """Update the window title to display the current file name"""
@@ -384,7 +398,6 @@ _double_click_threshold = 0.5  # seconds
 
 def handle_table_event(event, data_with_indices, window, sort_directions, fn=None, data_storage=None):
     """Handle table click events including sorting and row selection"""
-    import time
     global _last_click_time, _last_click_row
     
     try:
@@ -405,14 +418,13 @@ def handle_table_event(event, data_with_indices, window, sort_directions, fn=Non
                         elif col_num == 3:  # Time column
                             data_with_indices = safe_sort_by_time(data_with_indices, col_num, reverse=not current_direction)
                         else:
-                            data_with_indices = sorted(data_with_indices, key=lambda x: (x[1][col_num] is not None, x[1][col_num]),
-                                                     reverse=not current_direction)
+                            data_with_indices = sort_by_column(data_with_indices, col_num, lambda value: (value is not None, value),
+                                                               reverse=not current_direction)
                         sort_directions[col_num] = not current_direction
                         
                         # Update both table values and row colors after sorting
-                        from ui_components import update_table_display
                         update_table_display(data_with_indices, window)
-                        return data_with_indices
+                        return TableResult('sorted', data_with_indices)
             
             # ROW CLICK: We have a row click of some kind
             elif isinstance(event_data, tuple) and len(event_data) > 0:
@@ -424,7 +436,10 @@ def handle_table_event(event, data_with_indices, window, sort_directions, fn=Non
                         
                         # STATUS COLUMN CLICK: col_clicked == 4
                         if col_clicked == 4:  # Status column
-                            return handle_status_change(row_index, data_with_indices, window, data_storage, fn)
+                            updated_data = handle_status_change(row_index, data_with_indices, window, data_storage, fn)
+                            if updated_data is None:
+                                return NO_TABLE_RESULT
+                            return TableResult('status', updated_data)
                         else:
                             # DOUBLE-CLICK DETECTION for other columns
                             current_time = time.time()
@@ -435,18 +450,18 @@ def handle_table_event(event, data_with_indices, window, sort_directions, fn=Non
                                 # Double-click detected - show actions dialog
                                 _last_click_time = 0  # Reset to prevent triple-click
                                 _last_click_row = None
-                                return {'action': 'show_actions', 'row_index': row_index}
+                                return TableResult('action', row_index)
                             else:
                                 # Single-click - just record the click for potential double-click
                                 _last_click_time = current_time
                                 _last_click_row = row_index
                                 # Single-click just selects the row (no action)
-                                return None
+                                return NO_TABLE_RESULT
     
     except Exception as e:
         print(f"Error handling table event: {str(e)}")
     
-    return None
+    return NO_TABLE_RESULT
 
 def handle_menu_events(event, window, data_with_indices, fn):
     """Handle menu events like Open, Save As, Import, etc."""
@@ -489,7 +504,6 @@ def handle_menu_events(event, window, data_with_indices, fn):
                     # Migrate if necessary
                     if needs_migration:
                         print("Migrating loaded data to unified feedback format...")
-                        from session_management import migrate_all_game_sessions
                         loaded_data = migrate_all_game_sessions(loaded_data)
                         # Save migrated data
                         save_data(loaded_data, file_path)
@@ -563,36 +577,39 @@ def handle_menu_events(event, window, data_with_indices, fn):
                     sg.popup_error(f"Error converting Excel file: {str(e)}", location=convert_exception_location)
                     
     elif event == 'User Guide':
+        from help_dialogs import show_user_guide
         show_user_guide(window)
         
     elif event == 'Data Format Info':
+        from help_dialogs import show_data_format_info
         show_data_format_info(window)
         
     elif event == 'Troubleshooting':
+        from help_dialogs import show_troubleshooting_guide
         show_troubleshooting_guide(window)
         
     elif event == 'Feature Tour':
+        from help_dialogs import show_feature_tour
         show_feature_tour(window)
         
     elif event == 'Release Notes':
+        from help_dialogs import show_release_notes
         show_release_notes(window)
         
     elif event == 'Report Bug':
+        from help_dialogs import show_bug_report_info
         show_bug_report_info(window)
         
     elif event == 'About':
+        from help_dialogs import show_about_dialog
         show_about_dialog(window)
         
     elif event == 'Check for Updates':
         # Check for updates manually
-        from update_ui import check_for_updates_manual
         check_for_updates_manual(window)
         
     elif event == 'Update Settings':
         # Show update settings dialog
-        from update_ui import show_update_settings
-        from auto_updater import get_updater
-        
         settings = show_update_settings(window)
         if settings:
             updater = get_updater()
@@ -604,7 +621,6 @@ def handle_menu_events(event, window, data_with_indices, fn):
     elif event == 'View Activity by Date':
         # Show date picker dialog for viewing activity
         try:
-            from date_activity_view import show_date_picker_dialog, show_date_activity_view
             selected_date = show_date_picker_dialog(window)
             if selected_date:
                 show_date_activity_view(selected_date, data_with_indices, window)
@@ -616,8 +632,6 @@ def handle_menu_events(event, window, data_with_indices, fn):
     elif event == 'Today\'s Activity':
         # Show today's gaming activity
         try:
-            from date_activity_view import show_date_activity_view
-            from datetime import date
             today = date.today()
             show_date_activity_view(today, data_with_indices, window)
         except Exception as e:
@@ -628,8 +642,6 @@ def handle_menu_events(event, window, data_with_indices, fn):
     elif event == 'Yesterday\'s Activity':
         # Show yesterday's gaming activity
         try:
-            from date_activity_view import show_date_activity_view
-            from datetime import date, timedelta
             yesterday = date.today() - timedelta(days=1)
             show_date_activity_view(yesterday, data_with_indices, window)
         except Exception as e:
@@ -666,9 +678,8 @@ def handle_status_change(row_index, data_with_indices, window, data_storage=None
                             data_storage[i] = data_with_indices[row_index]
                             break
 
-                # Update both table values and row colors to reflect the status change
-                from ui_components import update_table_display
-                update_table_display(data_with_indices, window)
+                # Update the row's values and color to reflect the status change
+                update_table_row(data_with_indices, row_index, window)
                 
                 # Auto-save after status change
                 if fn:
@@ -830,7 +841,6 @@ def handle_game_action(row_index, data_with_indices, window, data_storage=None,
         game_name = game_data[0]
         
         # Show manual session popup
-        from session_management import show_manual_session_popup, add_manual_session_to_game
         session = show_manual_session_popup(game_name, window)
         if session:
             # Add session to game
@@ -860,10 +870,11 @@ def handle_game_action(row_index, data_with_indices, window, data_storage=None,
 def handle_session_table_click(values, selected_game, data_with_indices, window, fn=None, data_storage=None):
     """Handle clicks on the session table"""
     try:
-        if selected_game and values['-SESSIONS-TABLE-']:
+        selected_rows = values['-SESSIONS-TABLE-']
+        if selected_game and selected_rows:
             # Get the selected row index
-            if isinstance(values['-SESSIONS-TABLE-'], list) and len(values['-SESSIONS-TABLE-']) > 0:
-                selected_row = values['-SESSIONS-TABLE-'][0]
+            if isinstance(selected_rows, list):
+                selected_row = selected_rows[0]
                 # Get the sessions for this game
                 game_sessions = get_game_sessions(data_with_indices, selected_game)
                 
@@ -7,16 +7,21 @@ from datetime import datetime, timedelta
 from collections import defaultdict
 
 from constants import COMPLETED_STYLE, IN_PROGRESS_STYLE, FUTURE_RELEASE_STYLE, DEFAULT_STYLE
-from utilities import format_timedelta_with_seconds, get_game_table_row_colors
+from utilities import format_timedelta_with_seconds
 
 def count_total_completed(data_with_indices):
     """Count the total number of completed games"""
-    return sum(1 for row in data_with_indices if row[1][4] == 'Completed')
+    # list.count compares in C, which beats summing a generator
+    return [row[1][4] for row in data_with_indices].count('Completed')
 
 def count_total_entries(data):
     """Count the total number of game entries"""
     return len(data)
 
+def count_library_totals(data_with_indices):
+    """Count the total and completed games together as (total, completed)"""
+    return count_total_entries(data_with_indices), count_total_completed(data_with_indices)
+
 def calculate_completion_percentage(total_completed, total_entries):
     """Calculate the percentage of completed games"""
     if total_entries == 0:
@@ -84,25 +89,7 @@ def breakdown_by_year_and_status(data_with_indices):
 
 def update_summary(data_with_indices, window):
     """Update the summary display with current data"""
-    total_completed = count_total_completed(data_with_indices)
-    total_entries = count_total_entries(data_with_indices)
-    completion_percentage = calculate_completion_percentage(total_completed, total_entries)
-    breakdown = breakdown_by_year_and_status(data_with_indices)
-    breakdown_lines = [f"{year}: {status['Completed']} Completed, {status['Pending/In Progress']} Pending/In Progress"
-                       for year, status in breakdown.items()]
-    breakdown_text = '\n'.join(breakdown_lines)
-
-    # Update row colors based on status and rating type
-    from ui_components import get_display_row_with_rating
-    
-    # Get formatted display values
-    display_values = [get_display_row_with_rating(row[1]) for row in data_with_indices]
-    
-    # Get row colors that consider both status and rating type
-    row_colors = get_game_table_row_colors(data_with_indices)
-    
-    # Update the table with formatted data and enhanced colors
-    window['-TABLE-'].update(
-        values=display_values, 
-        row_colors=row_colors
-    ) 
\ No newline at end of file
+    # The games table is the only summary element on the Games List tab;
+    # totals and per-year breakdowns are shown by the Summary tab charts
+    from ui_components import update_table_display
+    update_table_display(data_with_indices, window) 
\ No newline at end of file
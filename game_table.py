@@ -0,0 +1,79 @@
+"""
+Column-oriented view of the games list for the GamesList application.
+Keeps per-column lists so search and filter scans don't have to walk every row.
+"""
+
+
+class GameTable:
+    """Parallel column lists built from data_with_indices, indexed by row position"""
+
+    def __init__(self, data_with_indices):
+        # The rows this table was built from - used to detect when it's stale
+        self.rows = data_with_indices
+        self.names = []
+        self.names_lower = []
+        self.released = []
+        self.sessions = []
+        self.status_history = []
+        # 1 for rows with sessions or status history, filled in as rows are read
+        self.has_activity = bytearray(len(data_with_indices))
+        # Lowercased text of every cell in a row, used by the Games List search
+        self.search_text = []
+        # Previous search query and the row positions it matched, for narrowing while typing
+        self._last_query = None
+        self._last_hits = None
+        # Sorted (name, lowercased name) pairs of games with sessions or status history
+        self._activity_candidates = None
+        # Previous game-with-activity query and the pairs it matched, for narrowing while typing
+        self._last_activity_query = None
+        self._last_activity_hits = None
+
+        for i, (_, row) in enumerate(data_with_indices):
+            sessions = row[7] if len(row) > 7 and row[7] else []
+            status_history = row[8] if len(row) > 8 and row[8] else []
+            self.names.append(row[0])
+            self.names_lower.append(str(row[0]).lower())
+            self.released.append(row[1])
+            self.sessions.append(sessions)
+            self.status_history.append(status_history)
+            if sessions or status_history:
+                self.has_activity[i] = 1
+            # Join with a character a search query can't contain so matches never span two cells
+            self.search_text.append('\0'.join(map(str, row)).lower())
+
+    def __len__(self):
+        return len(self.rows)
+
+    def is_current(self, data_with_indices):
+        """Check whether the table was built from this exact list and it hasn't grown or shrunk"""
+        return self.rows is data_with_indices and len(self.names) == len(data_with_indices)
+
+    def search(self, query):
+        """Return the rows whose cells contain the lowercased query"""
+        search_text = self.search_text
+        if self._last_query and query.startswith(self._last_query):
+            # A longer query can only match rows the shorter one matched
+            hits = [i for i in self._last_hits if query in search_text[i]]
+        else:
+            hits = [i for i, text in enumerate(search_text) if query in text]
+        self._last_query = query
+        self._last_hits = hits
+        rows = self.rows
+        return [rows[i] for i in hits]
+
+    def games_with_activity(self, query=''):
+        """Return sorted names of games with sessions or status history whose name contains the lowercased query"""
+        if self._activity_candidates is None:
+            names_lower = self.names_lower
+            self._activity_candidates = sorted(
+                (self.names[i], names_lower[i]) for i, flag in enumerate(self.has_activity) if flag)
+        if not query:
+            hits = self._activity_candidates
+        elif self._last_activity_query and query.startswith(self._last_activity_query):
+            # A longer query can only match games the shorter one matched
+            hits = [pair for pair in self._last_activity_hits if query in pair[1]]
+        else:
+            hits = [pair for pair in self._activity_candidates if query in pair[1]]
+        self._last_activity_query = query
+        self._last_activity_hits = hits
+        return [name for name, _ in hits]
@@ -6,7 +6,6 @@ Extracted from event_handlers.py for better modularity.
 import PySimpleGUI as sg
 import sys
 import platform
-import webbrowser
 from datetime import datetime
 from constants import VERSION
 from emoji_utils import emoji_image, get_emoji
@@ -588,6 +587,7 @@ def show_bug_report_info(parent_window=None):
         if event in (sg.WIN_CLOSED, 'Close'):
             break
         elif event == '-GITHUB-LINK-':
+            import webbrowser  # Deferred - probing for browsers is slow and rarely needed
             webbrowser.open('https://github.com/DrNefarius/GameTracker')
     
     bug_report_window.close()
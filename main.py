@@ -6,50 +6,994 @@ including play time, completion status, ratings, and notes.
 """
 
 import os
+import time
+import threading
+import traceback
+from bisect import bisect_left
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import PySimpleGUI as sg
 from datetime import datetime, timedelta
 
 # Import from our modules
 from constants import _DEBUG, QT_ENTER_KEY1, QT_ENTER_KEY2, STAR_FILLED, STAR_EMPTY
 from config import load_config, save_config
-from data_management import load_from_gmd, save_data
+from data_management import load_from_gmd, save_data, save_to_gmd
 from utilities import format_timedelta_with_seconds
-from game_statistics import update_summary, count_total_completed, count_total_entries, calculate_total_time
-from ui_components import create_main_layout, get_display_row_with_rating, create_entry_popup
+from game_statistics import update_summary, count_library_totals, calculate_total_time
+from ui_components import create_main_layout, get_display_row_with_rating, create_entry_popup, update_table_row, set_table_data
 from event_handlers import (
     handle_menu_events, handle_table_event, handle_game_action, 
-    handle_session_table_click, handle_add_entry
+    handle_session_table_click, handle_add_entry, update_statistics_tab, update_window_title,
+    compute_statistics_tab, apply_statistics_tab, get_statistics_game_names
 )
 from visualizations import update_summary_charts
-from session_management import display_all_game_notes, get_game_sessions, migrate_all_game_sessions, show_popup
-from ratings import show_rating_popup
+from session_management import (
+    display_all_game_notes, get_game_sessions, migrate_all_game_sessions, show_popup,
+    extract_all_sessions, find_most_active_period, show_manual_session_popup, add_manual_session_to_game
+)
+from ratings import show_rating_popup, get_session_rating_summary
 from discord_integration import initialize_discord, get_discord_integration, cleanup_discord
 from auto_updater import initialize_updater, get_updater
 from update_ui import show_update_notification, show_update_settings, handle_update_process, check_for_updates_manual
+from date_activity_view import show_date_picker_dialog, show_date_activity_view
+from utilities import calculate_popup_center_location
+from game_table import GameTable
 
 def get_full_dataset(data_with_indices, data_storage):
     """Get the full dataset for statistics - use data_storage if filtering is active, otherwise data_with_indices"""
     return data_storage if data_storage is not None else data_with_indices
 
-def force_scrollable_refresh(window):
-    """Force PySimpleGUI to recalculate scrollable areas by temporarily resizing the window"""
+# Heatmap window size choices in months
+_WINDOW_MONTHS = {'1 Month': 1, '3 Months': 3, '6 Months': 6, '1 Year': 12}
+# Distribution chart choices mapped to the chart type parameter
+_CHART_TYPE_MAP = {'Line Chart': 'line', 'Scatter Plot': 'scatter', 'Box Plot': 'box', 'Histogram': 'histogram'}
+# Tab keys mapped to the tab names shown in Discord presence
+_TAB_NAME_MAP = {'-TAB1-': 'Games List', '-TAB2-': 'Summary', '-TAB3-': 'Statistics'}
+
+# Quiet time after the last heatmap/year click before the Statistics tab is redrawn
+STATS_DEBOUNCE_SECONDS = 0.15
+# Quiet time after the last column header click before the games table is re-sorted
+SORT_DEBOUNCE_SECONDS = 0.05
+# Quiet time after the last keystroke in the Statistics game search before the list is filtered
+SESSION_SEARCH_DEBOUNCE_SECONDS = 0.15
+# How often the event loop wakes up while a debounced update is waiting, in ms
+DEBOUNCE_POLL_MS = 50
+
+# Game action dialog results that change the games data
+GAME_ACTIONS = frozenset({'game_edited', 'game_deleted', 'game_rated', 'time_tracked', 'session_added'})
+# Of those, the ones that can change the game count or completed count
+LIBRARY_TOTALS_ACTIONS = frozenset({'game_edited', 'game_deleted'})
+
+# Summary chart name -> Image element it is shown in
+SUMMARY_CHART_KEYS = (
+    ('pie_chart', '-PIE-CHART-'),
+    ('year_chart', '-YEAR-CHART-'),
+    ('playtime_chart', '-PLAYTIME-CHART-'),
+    ('rating_chart', '-RATING-CHART-'),
+)
+
+# Scrollable tab columns whose scroll region must follow their content
+SCROLLABLE_COLUMN_KEYS = ('-SUMMARY-COLUMN-', '-STATS-COLUMN-')
+
+def force_scrollable_refresh(window, *keys):
+    """Force PySimpleGUI to recalculate scrollable areas after their content changed
+
+    Only the given columns are refreshed; with no keys, all of SCROLLABLE_COLUMN_KEYS are.
+    """
     try:
-        # Get current window size
-        current_size = window.size
-        if current_size:
-            # Temporarily resize window by 1 pixel to force recalculation
-            window.size = (current_size[0] + 1, current_size[1])
-            window.read(timeout=1)  # Give PySimpleGUI time to process the resize
-            # Restore original size
-            window.size = current_size
-            window.read(timeout=1)  # Give PySimpleGUI time to process the resize back
+        # Let Tk finish pending geometry work so the new content size is known
+        window.TKroot.update_idletasks()
+        # Recompute each column's scroll region from its content's bounding box
+        for key in keys or SCROLLABLE_COLUMN_KEYS:
+            window[key].contents_changed()
     except Exception as e:
         print(f"Warning: Could not force scrollable refresh: {str(e)}")
 
+def request_scrollable_refresh(state, *keys):
+    """Mark scrollable columns whose content changed, to be refreshed once after the current event"""
+    state.pending_scroll_refresh.update(keys)
+
+def run_pending_scrollable_refresh(window, state):
+    """Refresh the scrollable columns marked while handling this event, once each"""
+    if state.pending_scroll_refresh:
+        force_scrollable_refresh(window, *state.pending_scroll_refresh)
+        state.pending_scroll_refresh.clear()
+
+# Summary chart PNG bytes by charts revision, so unchanged data is never rendered twice
+_charts_cache = OrderedDict()
+_CHARTS_CACHE_SIZE = 4
+# Summary charts render one job at a time, in the order they were asked for
+_charts_executor = ThreadPoolExecutor(max_workers=1)
+# PNG bytes each Summary Image element is showing, by element key
+_shown_charts = {}
+
+def show_summary_charts(window, charts):
+    """Show rendered Summary chart images in the Summary tab"""
+    # Charts whose input columns didn't change come back byte-identical, so leave those images alone
+    images = [(key, window[key], charts[name]) for name, key in SUMMARY_CHART_KEYS
+              if _shown_charts.get(key) != charts[name]]
+    if not images:
+        return
+
+    def apply_charts():
+        for key, image, png_bytes in images:
+            image.update(data=png_bytes)
+            _shown_charts[key] = png_bytes
+        force_scrollable_refresh(window, '-SUMMARY-COLUMN-')
+
+    # Swap the changed images in one idle callback so Tk lays out and repaints once
+    window.TKroot.after_idle(apply_charts)
+
+def start_summary_charts(window, state, use_cache=True):
+    """Render the Summary charts on a worker thread; the result arrives as a -CHARTS-READY- event"""
+    revision = state.charts_revision()
+    state.summary_charts_revision = revision
+    if use_cache and revision in _charts_cache:
+        _charts_cache.move_to_end(revision)
+        show_summary_charts(window, _charts_cache[revision])
+        return
+    window['-CHARTS-STATUS-'].update("Generating charts...")
+    # A render still waiting in the queue is for older data and no longer needed
+    if state.charts_future is not None:
+        state.charts_future.cancel()
+    # Render from a snapshot so edits made while the worker runs can't change the list under it
+    snapshot = list(state.data_with_indices)
+    state.charts_future = _charts_executor.submit(
+        lambda: window.write_event_value('-CHARTS-READY-', (revision, update_summary_charts(snapshot))))
+
+def start_statistics_update(window, state, **kwargs):
+    """Compute the Statistics tab on a worker thread; the result arrives as a -STATS-READY- event"""
+    # Only the newest job's result is shown, so an older job finishing late is ignored
+    state.stats_job_id += 1
+    job_id = state.stats_job_id
+    revision = state.data_revision
+    window['-SELECTED-GAME-'].update("Loading statistics...")
+    data = list(state.data_with_indices)
+    full_dataset = list(get_full_dataset(state.data_with_indices, state.data_storage))
+
+    def worker():
+        try:
+            statistics = compute_statistics_tab(data, full_dataset=full_dataset, **kwargs)
+        except Exception as e:
+            print(f"Error computing statistics: {str(e)}")
+            statistics = None
+        window.write_event_value('-STATS-READY-', (job_id, revision, statistics))
+
+    threading.Thread(target=worker, daemon=True).start()
+
+def draw_statistics_tab(window, state, **kwargs):
+    """Redraw the Statistics tab right away, superseding any statistics still being computed on a worker"""
+    state.stats_job_id += 1
+    update_statistics_tab(window, state.data_with_indices, **kwargs)
+
+def schedule_statistics_update(state, **kwargs):
+    """Queue an update_statistics_tab call, replacing any queued one, until clicks stop for a moment"""
+    state.pending_stats_args = kwargs
+    state.pending_stats_deadline = time.monotonic() + STATS_DEBOUNCE_SECONDS
+
+def run_pending_statistics_update(window, state):
+    """Run the queued update_statistics_tab call once its quiet period has passed"""
+    if state.pending_stats_args is None or time.monotonic() < state.pending_stats_deadline:
+        return
+    kwargs = state.pending_stats_args
+    state.pending_stats_args = None
+    draw_statistics_tab(window, state, **kwargs,
+                          **get_cached_statistics_inputs(state, kwargs.get('selected_game')))
+    request_scrollable_refresh(state, '-STATS-COLUMN-')
+
+def schedule_table_sort(event, window, values, state):
+    """Queue a column header click, counting repeated clicks on the same column until they stop"""
+    column = event[2][1]
+    if state.pending_sort_event is not None and state.pending_sort_event[2][1] == column:
+        state.pending_sort_clicks += 1
+    else:
+        if state.pending_sort_event is not None:
+            # A different column was clicked - sort by the waiting one now rather than dropping it
+            flush_table_sort(window, values, state)
+        state.pending_sort_clicks = 1
+    state.pending_sort_event = event
+    state.pending_sort_deadline = time.monotonic() + SORT_DEBOUNCE_SECONDS
+
+def run_pending_table_sort(window, values, state):
+    """Sort the games table once for a burst of header clicks, ending in the direction the last click asked for"""
+    if state.pending_sort_event is None or time.monotonic() < state.pending_sort_deadline:
+        return
+    flush_table_sort(window, values, state)
+
+def flush_table_sort(window, values, state):
+    """Run the queued header click sort right away"""
+    event = state.pending_sort_event
+    column = event[2][1]
+    # Each click flips the direction; apply all but the last flip here and let the sort do the last one
+    if state.pending_sort_clicks % 2 == 0:
+        state.sort_directions[column] = not state.sort_directions[column]
+    state.pending_sort_event = None
+    state.pending_sort_clicks = 0
+    _handle_table(event, window, values, state)
+
+class AppState:
+    """Mutable state shared by the main event loop and its event handlers"""
+
+    def __init__(self, data_with_indices, fn, discord):
+        self.data_with_indices = data_with_indices
+        self.fn = fn
+        self.discord = discord
+        self.data_storage = None  # For storing complete dataset when filtering
+        self.selected_game_for_stats = None
+        # Track which tabs have been loaded
+        self.tabs_loaded = {0: True, 1: False, 2: False}
+        # Whether the games table still shows data that was replaced while its tab was hidden
+        self.games_table_stale = False
+        # Whether the loaded Statistics tab shows data that was edited while its tab was hidden
+        self.statistics_stale = False
+        # State for sorting direction
+        self.sort_directions = {i: True for i in range(8)}  # 8 columns
+        # Column view of the full dataset, rebuilt lazily after the data changes
+        self.game_table = None
+        # Charts revision the Summary charts were last drawn for; edits made while the tab is hidden redraw on switch
+        self.summary_charts_revision = None
+        # Latest Summary chart render submitted to the chart worker
+        self.charts_future = None
+        # Id of the latest background Statistics tab job
+        self.stats_job_id = 0
+        # Bumped whenever data_with_indices is replaced or edited
+        self.data_revision = 0
+        # Bumped whenever the rows are reordered without being edited
+        self.order_revision = 0
+        # Whether the in-memory data may differ from what was last written to fn
+        self.unsaved_changes = False
+        # Session lists by game name (None for all games), valid for one data revision
+        self.sessions_cache = {}
+        self.sessions_cache_revision = None
+        # Session rating summaries by game name, valid for one data revision
+        self.rating_summaries = {}
+        self.rating_summaries_revision = None
+        # (total games, completed games) of the full library, valid for one data revision
+        self.library_totals = None
+        self.library_totals_revision = None
+        # Names listed in the Statistics game list, valid for one data revision
+        self.stats_game_names = None
+        self.stats_game_names_revision = None
+        # End date of the heatmap period being viewed, None for the latest data
+        self.heatmap_end_date = None
+        # Year the contributions map shows, as displayed in -CONTRIB-YEAR-DISPLAY-
+        self.contributions_year = datetime.now().year
+        # Debounced update_statistics_tab arguments and when to run them
+        self.pending_stats_args = None
+        self.pending_stats_deadline = 0.0
+        # Scrollable column keys to refresh once the current event has been handled
+        self.pending_scroll_refresh = set()
+        # Debounced column header click, how many times that column was clicked, and when to sort
+        self.pending_sort_event = None
+        self.pending_sort_clicks = 0
+        self.pending_sort_deadline = 0.0
+        # Debounced Statistics game search query and when to filter the list with it
+        self.pending_session_query = None
+        self.pending_session_query_deadline = 0.0
+
+    def has_pending_updates(self):
+        """Check whether a debounced update is waiting for the event loop to run it"""
+        return (self.pending_stats_args is not None or self.pending_sort_event is not None
+                or self.pending_session_query is not None)
+
+    def data_changed(self):
+        """Invalidate everything derived from the game data after an edit"""
+        self.data_revision += 1
+        # Statistics still being computed on a worker are for the old data
+        self.stats_job_id += 1
+        self.game_table = None
+        self.unsaved_changes = True
+
+    def order_changed(self):
+        """Invalidate only what depends on row order after the games table is sorted"""
+        # The playtime chart plots rows in table order; everything else is order independent
+        self.order_revision += 1
+        self.game_table = None
+        self.unsaved_changes = True
+
+    def charts_revision(self):
+        """Get the revision the Summary charts are cached under, covering both edits and row order"""
+        return (self.data_revision, self.order_revision)
+
+def get_cached_sessions(state, game_name=None):
+    """Get the sessions of one game, or of all games, reusing them until the data changes"""
+    if state.sessions_cache_revision != state.data_revision:
+        state.sessions_cache = {}
+        state.sessions_cache_revision = state.data_revision
+    sessions = state.sessions_cache.get(game_name)
+    if sessions is None:
+        if game_name is None:
+            sessions = extract_all_sessions(state.data_with_indices)
+        else:
+            sessions = get_game_sessions(state.data_with_indices, game_name)
+        state.sessions_cache[game_name] = sessions
+    return sessions
+
+def update_library_stats(state):
+    """Pass the library's game and completed counts to Discord, counting them again only after the data changes"""
+    if state.library_totals_revision != state.data_revision:
+        full_dataset = get_full_dataset(state.data_with_indices, state.data_storage)
+        state.library_totals = count_library_totals(full_dataset)
+        state.library_totals_revision = state.data_revision
+    state.discord.update_game_library_stats(*state.library_totals)
+    return state.library_totals
+
+def get_cached_game_names(state):
+    """Get the Statistics game list names, scanning the full library again only after the data changes"""
+    if state.stats_game_names_revision != state.data_revision:
+        full_dataset = get_full_dataset(state.data_with_indices, state.data_storage)
+        state.stats_game_names = get_statistics_game_names(full_dataset)
+        state.stats_game_names_revision = state.data_revision
+    return state.stats_game_names
+
+def get_cached_rating_summary(state, game_name):
+    """Get a game's session rating summary, summarizing its sessions again only after the data changes"""
+    if state.rating_summaries_revision != state.data_revision:
+        state.rating_summaries = {}
+        state.rating_summaries_revision = state.data_revision
+    if game_name not in state.rating_summaries:
+        state.rating_summaries[game_name] = get_session_rating_summary(get_cached_sessions(state, game_name))
+    return state.rating_summaries[game_name]
+
+def get_cached_statistics_inputs(state, selected_game=None):
+    """Get the session lists, game names and rating summary update_statistics_tab needs as keyword arguments, from the caches"""
+    return {'all_sessions': get_cached_sessions(state),
+            'game_sessions': get_cached_sessions(state, selected_game) if selected_game else None,
+            'game_names': get_cached_game_names(state),
+            'session_rating_summary': get_cached_rating_summary(state, selected_game) if selected_game else None}
+
+def get_game_table(state, data):
+    """Get the column view for data, rebuilding it if the data was replaced or changed"""
+    if state.game_table is None or not state.game_table.is_current(data):
+        state.game_table = GameTable(data)
+    return state.game_table
+
+# Menu events routed to handle_menu_events
+MENU_EVENTS = (
+    'Open', 'Save As', 'Import from Excel', 'User Guide',
+    'Feature Tour', 'Data Format Info', 'Troubleshooting',
+    'Check for Updates', 'Update Settings', 'Release Notes', 'Report Bug', 'About',
+    'View Activity by Date', 'Today\'s Activity', 'Yesterday\'s Activity'
+)
+
+# Key suffix of the Discord on/off menu item, whose text shows the current state
+DISCORD_TOGGLE_SUFFIX = '::discord_toggle'
+
+# Keys that trigger a search from the Games List tab
+SEARCH_EVENTS = ('Search', '\r', QT_ENTER_KEY1, QT_ENTER_KEY2)
+
+def _refresh_current_tab(window, values, state):
+    """Redraw the tab that is showing after new data was loaded; the hidden tabs are redrawn when opened"""
+    active_tab = values['-TABGROUP-']
+    if active_tab == '-TAB1-':
+        update_summary(state.data_with_indices, window)
+    state.games_table_stale = active_tab != '-TAB1-'
+
+    # The Summary tab notices the new data revision itself when it is opened
+    if active_tab == '-TAB2-':
+        start_summary_charts(window, state)
+
+    if active_tab == '-TAB3-':
+        draw_statistics_tab(window, state, selected_game=None, update_game_list=True,
+                              **get_cached_statistics_inputs(state))
+        request_scrollable_refresh(state, '-STATS-COLUMN-')
+    else:
+        # Load the Statistics tab from scratch for the new file when it is next opened
+        state.tabs_loaded[2] = False
+
+def _replace_loaded_data(result, window, values, state):
+    """Switch to the data of a file that was just opened or converted and refresh the UI for it"""
+    state.data_with_indices = result['data']
+    state.fn = result['filename']
+    state.data_storage = None  # Reset data storage
+    state.unsaved_changes = False  # Just read from / written to disk
+
+    # Update Discord with the new file's stats
+    update_library_stats(state)
+
+    # Map tab key to tab name for Discord
+    current_tab_key = values['-TABGROUP-']
+    current_tab = _TAB_NAME_MAP.get(current_tab_key, 'Games List')
+    state.discord.update_presence_browsing(current_tab)
+
+    _refresh_current_tab(window, values, state)
+
+def _handle_menu(event, window, values, state):
+    """Handle menu events"""
+    result = handle_menu_events(event, window, state.data_with_indices, state.fn)
+    if result:
+        if result.get('action') in ('file_loaded', 'file_converted'):
+            state.data_changed()
+            _replace_loaded_data(result, window, values, state)
+        elif result.get('action') == 'file_saved':
+            # Saving leaves the data as it was, so every cache stays valid
+            state.fn = result['filename']
+            state.unsaved_changes = False
+
+def _handle_tab_change(event, window, values, state):
+    """Handle tab changes"""
+    current_tab_key = values['-TABGROUP-']
+
+    # Map tab keys to actual tab names
+    current_tab = _TAB_NAME_MAP.get(current_tab_key, current_tab_key)
+
+    # Debug: print tab change information
+    print(f"Main: Tab changed to '{current_tab}' (key: '{current_tab_key}')")
+
+    # Update Discord presence based on tab - also update game stats
+    total_games, completed_games = update_library_stats(state)
+    print(f"Main: Updating Discord with {total_games} games, {completed_games} completed")
+    state.discord.update_presence_browsing(current_tab)
+
+    if current_tab_key == '-TAB1-' and state.games_table_stale:
+        # A file was loaded while the Games List was hidden
+        update_summary(state.data_with_indices, window)
+        state.games_table_stale = False
+    elif current_tab_key == '-TAB2-' and state.summary_charts_revision != state.charts_revision():
+        # First time loading the Summary tab, or the data changed while it was hidden - generate charts
+        start_summary_charts(window, state)
+        state.tabs_loaded[1] = True
+    elif current_tab_key == '-TAB3-' and not state.tabs_loaded[2]:
+        # First time loading the Statistics tab - update statistics
+        # Initialize year display to current year or latest data year
+        show_contributions_year(window, state, datetime.now().year)
+
+        start_statistics_update(window, state, selected_game=None, update_game_list=True)
+        state.tabs_loaded[2] = True
+        state.statistics_stale = False
+    elif current_tab_key == '-TAB3-' and state.statistics_stale:
+        # A game action changed the data while the Statistics tab was hidden
+        redraw_statistics_tab(window, values, state)
+
+def _handle_refresh_charts(event, window, values, state):
+    """Handle chart refresh"""
+    start_summary_charts(window, state, use_cache=False)
+
+def _handle_charts_ready(event, window, values, state):
+    """Show the Summary charts rendered by the worker thread"""
+    revision, charts = values[event]
+    if charts:
+        _charts_cache[revision] = charts
+        _charts_cache.move_to_end(revision)
+        while len(_charts_cache) > _CHARTS_CACHE_SIZE:
+            _charts_cache.popitem(last=False)
+    # Charts for data that has changed since are only cached, not shown
+    if revision != state.charts_revision():
+        return
+    window['-CHARTS-STATUS-'].update("")
+    if charts:
+        show_summary_charts(window, charts)
+
+def _handle_stats_ready(event, window, values, state):
+    """Show the Statistics tab computed by the worker thread"""
+    job_id, revision, statistics = values[event]
+    # A newer redraw or a data change since the job started makes its result stale
+    if job_id != state.stats_job_id or revision != state.data_revision or statistics is None:
+        return
+    apply_statistics_tab(window, statistics)
+    request_scrollable_refresh(state, '-STATS-COLUMN-')
+
+def _handle_refresh_stats(event, window, values, state):
+    """Handle statistics refresh"""
+    # Get currently selected game if any
+    selected_game = None
+    if values['-GAME-LIST-']:
+        selected_game = values['-GAME-LIST-'][0]
+    draw_statistics_tab(window, state, selected_game=selected_game)
+
+def show_contributions_year(window, state, year):
+    """Set the year the contributions map shows and put it in the year display"""
+    state.contributions_year = year
+    window['-CONTRIB-YEAR-DISPLAY-'].update(str(year))
+
+def _step_contributions_year(window, values, state, step):
+    """Move the contributions map one year backwards or forwards and refresh it"""
+    try:
+        show_contributions_year(window, state, state.contributions_year + step)
+
+        # Refresh contributions map with new year, keeping the other heatmap settings
+        schedule_statistics_update(state, update_game_list=False, **_read_heatmap_context(values, state))
+    except Exception as e:
+        print(f"Error changing year: {str(e)}")
+
+def _handle_year_prev(event, window, values, state):
+    """Handle contributions year navigation backwards"""
+    _step_contributions_year(window, values, state, -1)
+
+def _handle_year_next(event, window, values, state):
+    """Handle contributions year navigation forwards"""
+    _step_contributions_year(window, values, state, 1)
+
+def _read_heatmap_context(values, state):
+    """Read the selected game, heatmap window size and contributions year shared by the heatmap controls"""
+    selected_game = values['-GAME-LIST-'][0] if values['-GAME-LIST-'] else None
+    window_months = _WINDOW_MONTHS.get(values.get('-HEATMAP-WINDOW-SIZE-'), 1)
+    return {'selected_game': selected_game, 'heatmap_window_months': window_months,
+            'contributions_year': state.contributions_year}
+
+def _read_statistics_view(values, state):
+    """Read the heatmap context plus the heatmap period and distribution chart type the Statistics tab is showing"""
+    view = _read_heatmap_context(values, state)
+    view['heatmap_end_date'] = state.heatmap_end_date
+    view['distribution_chart_type'] = _CHART_TYPE_MAP.get(values.get('-DISTRIBUTION-CHART-TYPE-'), 'line')
+    return view
+
+def _handle_heatmap_window_size(event, window, values, state):
+    """Handle heatmap window size change"""
+    try:
+        # Update heatmap with new window size
+        schedule_statistics_update(state, update_game_list=False, **_read_heatmap_context(values, state))
+    except Exception as e:
+        print(f"Error changing heatmap window size: {str(e)}")
+
+def _handle_distribution_chart_type(event, window, values, state):
+    """Handle distribution chart type change"""
+    try:
+        # Update statistics with new chart type
+        view = _read_statistics_view(values, state)
+        draw_statistics_tab(window, state, update_game_list=False, **view,
+                            **get_cached_statistics_inputs(state, view['selected_game']))
+    except Exception as e:
+        print(f"Error changing distribution chart type: {str(e)}")
+        traceback.print_exc()
+
+def _handle_heatmap_prev(event, window, values, state):
+    """Handle heatmap navigation backwards"""
+    try:
+        context = _read_heatmap_context(values, state)
+        window_days = context['heatmap_window_months'] * 30
+
+        # Calculate new end date (move back by window size)
+        if state.heatmap_end_date:
+            new_end_date = state.heatmap_end_date - timedelta(days=window_days)
+        else:
+            # First time navigating, start from current date
+            new_end_date = datetime.now().date() - timedelta(days=window_days)
+        state.heatmap_end_date = new_end_date
+
+        # Update heatmap with new date range
+        schedule_statistics_update(state, update_game_list=False, heatmap_end_date=new_end_date, **context)
+    except Exception as e:
+        print(f"Error navigating heatmap backwards: {str(e)}")
+
+def _handle_heatmap_next(event, window, values, state):
+    """Handle heatmap navigation forwards"""
+    try:
+        context = _read_heatmap_context(values, state)
+
+        # Calculate new end date (move forward by window size), not beyond the current date
+        today = datetime.now().date()
+        if state.heatmap_end_date:
+            new_end_date = min(state.heatmap_end_date + timedelta(days=context['heatmap_window_months'] * 30), today)
+        else:
+            # First time navigating, start from current date
+            new_end_date = today
+        state.heatmap_end_date = new_end_date
+
+        # Update heatmap with new date range
+        schedule_statistics_update(state, update_game_list=False, heatmap_end_date=new_end_date, **context)
+    except Exception as e:
+        print(f"Error navigating heatmap forwards: {str(e)}")
+
+def _handle_heatmap_latest(event, window, values, state):
+    """Handle jumping to the latest heatmap period"""
+    try:
+        # Reset to latest data (current date)
+        state.heatmap_end_date = None
+
+        context = _read_heatmap_context(values, state)
+        draw_statistics_tab(window, state, update_game_list=False, heatmap_end_date=None,
+                            **context, **get_cached_statistics_inputs(state, context['selected_game']))
+    except Exception as e:
+        print(f"Error jumping to latest heatmap period: {str(e)}")
+
+def _handle_heatmap_most_active(event, window, values, state):
+    """Handle jumping to the most active heatmap period"""
+    try:
+        context = _read_heatmap_context(values, state)
+
+        # Find most active period of the selected game, or of all games
+        sessions = get_cached_sessions(state, context['selected_game'])
+        most_active_end_date = find_most_active_period(sessions, context['heatmap_window_months'])
+        state.heatmap_end_date = most_active_end_date
+
+        draw_statistics_tab(window, state, update_game_list=False,
+                            heatmap_end_date=most_active_end_date, **context,
+                            **get_cached_statistics_inputs(state, context['selected_game']))
+    except Exception as e:
+        print(f"Error jumping to most active heatmap period: {str(e)}")
+
+def _handle_game_list(event, window, values, state):
+    """Handle game list selection in Statistics tab"""
+    try:
+        selected = values['-GAME-LIST-']
+        if selected:
+            state.selected_game_for_stats = selected[0]
+
+            # Holding an arrow key fires a selection per row; only the last one is drawn
+            schedule_statistics_update(state, update_game_list=False, **_read_statistics_view(values, state))
+    except Exception as e:
+        print(f"Error handling game selection: {str(e)}")
+        sg.popup_error(f"Error selecting game: {str(e)}", title="Error")
+
+def _handle_show_all_games(event, window, values, state):
+    """Handle show all games button"""
+
+    # Get current chart type selection
+    chart_type = _CHART_TYPE_MAP.get(values.get('-DISTRIBUTION-CHART-TYPE-'), 'line')
+
+    state.selected_game_for_stats = None
+    window['-GAME-LIST-'].update(set_to_index=[])  # Clear selection in listbox
+
+    # Clear selected game from Discord tracking and update to general stats
+    state.discord.update_presence_viewing_stats(None)
+
+    draw_statistics_tab(window, state, selected_game=None, update_game_list=True,
+                        distribution_chart_type=chart_type, **get_cached_statistics_inputs(state))
+    request_scrollable_refresh(state, '-STATS-COLUMN-')
+
+def filter_session_game_list(window, state, search_query):
+    """Show the games with activity whose name contains the lowercased query in the Statistics game list"""
+    # Use original dataset if available, otherwise use current filtered view
+    search_data = state.data_storage if state.data_storage is not None else state.data_with_indices
+    window['-GAME-LIST-'].update(values=get_game_table(state, search_data).games_with_activity(search_query))
+
+def run_pending_session_search(window, state):
+    """Filter the Statistics game list once typing in its search box has paused"""
+    if state.pending_session_query is None or time.monotonic() < state.pending_session_query_deadline:
+        return
+    search_query = state.pending_session_query
+    state.pending_session_query = None
+    filter_session_game_list(window, state, search_query)
+
+def _handle_session_search(event, window, values, state):
+    """Handle session search, both while typing and from the search button"""
+    search_query = values['-SESSION-SEARCH-'].lower()
+    if event == '-SESSION-SEARCH-':
+        # Typing: wait for a pause so a burst of keystrokes redraws the list once
+        state.pending_session_query = search_query
+        state.pending_session_query_deadline = time.monotonic() + SESSION_SEARCH_DEBOUNCE_SECONDS
+        return
+    state.pending_session_query = None
+    filter_session_game_list(window, state, search_query)
+
+def _handle_search(event, window, values, state):
+    """Handle search"""
+    query = values['-SEARCH-'].lower().strip()
+    if state.data_storage is None:  # keep the whole dataset once before filtering
+        # No copy needed: filtering only rebinds data_with_indices to a new list
+        state.data_storage = state.data_with_indices
+
+    # Always filter from the original dataset (data_storage), not from current filtered view
+    # This prevents nested filtering where each new search filters the already filtered results
+    if not query:
+        # If query is empty, show all entries (as a separate list, since edits update both)
+        state.data_with_indices = state.data_storage.copy()
+    else:
+        state.data_with_indices = get_game_table(state, state.data_storage).search(query)
+    state.data_revision += 1
+    state.unsaved_changes = True
+
+    update_summary(state.data_with_indices, window)
+
+def _handle_reset(event, window, values, state):
+    """Handle search reset"""
+    if state.data_storage is not None:
+        # Restore original data but reset indices to avoid duplication -
+        # entries added while filtering take len(data_storage) as their index
+        if all(row[0] == i for i, row in enumerate(state.data_storage)):
+            # Indices are already 0..n-1, so the stored list can be shown as is
+            state.data_with_indices = state.data_storage
+        else:
+            state.data_with_indices = [(i, row[1]) for i, row in enumerate(state.data_storage)]
+        state.data_storage = None
+        state.data_revision += 1
+        state.unsaved_changes = True
+    window['-SEARCH-'].update('')
+    update_summary(state.data_with_indices, window)
+
+def _handle_save(event, window, values, state):
+    """Handle save"""
+    save_location = calculate_popup_center_location(window, popup_width=500, popup_height=200)
+    if not state.unsaved_changes:
+        sg.popup(f'Nothing to save - {state.fn} is already up to date.', title='Manual Save', location=save_location)
+        return
+    save_data(state.data_with_indices, state.fn, state.data_storage)
+    state.unsaved_changes = False
+    update_window_title(window, state.fn)
+    sg.popup(f'Data manually saved to {state.fn}!\n\nNote: Most operations now auto-save. Manual save is mainly needed for search/filter changes or as backup.', title='Manual Save Confirmation', location=save_location)
+
+def _handle_add_entry(event, window, values, state):
+    """Handle add entry"""
+    result = handle_add_entry(state.data_with_indices, window, state.fn, state.data_storage)
+    if result and result.get('action') == 'entry_added':
+        state.data_with_indices = result['data']
+        state.data_changed()
+
+        # Update Discord stats after adding entry
+        update_library_stats(state)
+        state.discord.update_presence_browsing(values['-TABGROUP-'])
+
+        update_summary(state.data_with_indices, window)
+
+def _is_header_click(event):
+    """Check whether a table click event is a click on a column header"""
+    event_data = event[2] if len(event) > 2 else None
+    return (isinstance(event_data, tuple) and len(event_data) > 1
+            and event_data[0] == -1 and event_data[1] is not None and event_data[1] != -1)
+
+def _handle_table_click(event, window, values, state):
+    """Handle table clicks, holding back header clicks so a quick burst sorts only once"""
+    if _is_header_click(event):
+        schedule_table_sort(event, window, values, state)
+    else:
+        _handle_table(event, window, values, state)
+
+def _handle_table(event, window, values, state):
+    """Handle table events"""
+    result = handle_table_event(event, state.data_with_indices, window, state.sort_directions, state.fn, state.data_storage)
+    if result.kind != 'none':
+        if result.kind == 'sorted':  # Same rows in a new order
+            state.order_changed()
+            state.data_with_indices = result.payload
+        elif result.kind == 'status':  # New data list returned
+            # Status changes edit rows in place
+            state.data_changed()
+            state.data_with_indices = result.payload
+        elif result.kind == 'action':
+            action_result = handle_game_action(
+                result.payload, state.data_with_indices, window,
+                state.data_storage, state.fn
+            )
+
+            if action_result:
+                if action_result.get('action') == 'view_statistics':
+                    state.data_with_indices = action_result['data']
+                    show_game_statistics(window, state, action_result['game_name'])
+                elif action_result.get('action') in GAME_ACTIONS:
+                    # The action dialog edited rows in place
+                    state.data_changed()
+                    apply_game_action(window, values, state, action_result, result.payload)
+
+def show_game_statistics(window, state, game_name):
+    """Switch to the Statistics tab with game_name selected, or explain why it has nothing to show"""
+    # Switch to Statistics tab (index 2)
+    window['-TABGROUP-'].Widget.select(2)
+
+    # Update tab tracking
+    if not state.tabs_loaded[2]:
+        show_contributions_year(window, state, datetime.now().year)
+        state.tabs_loaded[2] = True
+
+    # Build the game list and the selected game's statistics in one pass, then apply them once
+    state.stats_job_id += 1
+    statistics = compute_statistics_tab(state.data_with_indices, selected_game=game_name,
+                                        update_game_list=True,
+                                        **get_cached_statistics_inputs(state, game_name))
+    game_list_values = statistics['game_names']
+
+    # Find the game in the list (sorted by get_statistics_game_names) and select it
+    game_index = bisect_left(game_list_values, game_name)
+    if game_index < len(game_list_values) and game_list_values[game_index] == game_name:
+        apply_statistics_tab(window, statistics)
+        window['-GAME-LIST-'].update(set_to_index=[game_index], scroll_to_index=game_index)
+
+        # Update the selected game variable for other features like "View Activity Log"
+        state.selected_game_for_stats = game_name
+
+        # Update Discord presence for viewing stats
+        state.discord.update_presence_viewing_stats(game_name)
+    else:
+        # Show all games behind the message, as the tab would on its own
+        draw_statistics_tab(window, state, selected_game=None, update_game_list=True,
+                              **get_cached_statistics_inputs(state))
+        # Game doesn't have sessions/statistics data, show message
+        stats_location = calculate_popup_center_location(window, popup_width=400, popup_height=150)
+        sg.popup(f"'{game_name}' doesn't have any session data or statistics to display.",
+                title="No Statistics Available", icon='gameslisticon.ico', location=stats_location)
+        # Switch back to Games List tab
+        window['-TABGROUP-'].Widget.select(0)
+
+    request_scrollable_refresh(state, '-STATS-COLUMN-')
+
+def apply_game_action(window, values, state, action_result, row_index):
+    """Take on the data from an action in GAME_ACTIONS and update the Games List, Discord and the open tab"""
+    action = action_result['action']
+    state.data_with_indices = action_result['data']
+
+    # Update Discord stats after game actions that can change the totals
+    if action in LIBRARY_TOTALS_ACTIONS:
+        update_library_stats(state)
+
+    # Map tab key to tab name for Discord
+    current_tab_key = values['-TABGROUP-']
+    current_tab = _TAB_NAME_MAP.get(current_tab_key, 'Games List')
+    state.discord.update_presence_browsing(current_tab)
+
+    if action == 'game_deleted':
+        update_summary(state.data_with_indices, window)
+    else:
+        # Only the acted-on row changed, so patch it instead of reloading the table
+        update_table_row(state.data_with_indices, row_index, window)
+    # Redraw the open tab from the -DATA-CHANGED- handler, with the values read after the dialog closed
+    window.write_event_value('-DATA-CHANGED-', action)
+
+def redraw_statistics_tab(window, values, state):
+    """Redraw the Statistics tab for the current data, keeping the selected game and the heatmap and chart settings"""
+    view = _read_statistics_view(values, state)
+    draw_statistics_tab(window, state, update_game_list=True, **view,
+                        **get_cached_statistics_inputs(state, view['selected_game']))
+    request_scrollable_refresh(state, '-STATS-COLUMN-')
+    state.statistics_stale = False
+
+def _handle_data_changed(event, window, values, state):
+    """Redraw the Summary or Statistics tab, if it's the one showing, after a game action changed the data"""
+    active_tab = values['-TABGROUP-']
+    if active_tab == '-TAB2-':
+        start_summary_charts(window, state)
+    # Update statistics tab if it's currently active
+    elif active_tab == '-TAB3-':
+        redraw_statistics_tab(window, values, state)
+    # Otherwise redraw the Statistics tab when it is next opened
+    if active_tab != '-TAB3-':
+        state.statistics_stale = True
+
+def _handle_sessions_table(event, window, values, state):
+    """Handle session table clicks"""
+    if not values['-SESSIONS-TABLE-']:
+        return
+    result = handle_session_table_click(
+        values, state.selected_game_for_stats, state.data_with_indices, window, state.fn, state.data_storage
+    )
+    if result:
+        state.data_changed()
+    # The statistics tab will be updated within the handler if needed
+
+def _handle_view_all_notes(event, window, values, state):
+    """Handle view all notes button"""
+    try:
+        if state.selected_game_for_stats:
+            game_sessions = get_cached_sessions(state, state.selected_game_for_stats)
+            display_all_game_notes(state.selected_game_for_stats, game_sessions, state.data_with_indices, window)
+        else:
+            no_game_location = calculate_popup_center_location(window, popup_width=300, popup_height=120)
+            sg.popup("Please select a game first", title="No Game Selected", icon='gameslisticon.ico', location=no_game_location)
+    except Exception as e:
+        print(f"Error displaying all notes: {str(e)}")
+        error_location = calculate_popup_center_location(window, popup_width=400, popup_height=150)
+        sg.popup_error(f"Error displaying notes: {str(e)}", title="Error", location=error_location)
+
+def _handle_view_date_activity(event, window, values, state):
+    """Handle view date activity button"""
+    try:
+        # Show date picker dialog
+        selected_date = show_date_picker_dialog(window)
+        if selected_date:
+            # Get full dataset to include all activities, not just filtered view
+            full_dataset = get_full_dataset(state.data_with_indices, state.data_storage)
+            # Show activity view for the selected date
+            show_date_activity_view(selected_date, full_dataset, window)
+    except Exception as e:
+        print(f"Error showing date activity view: {str(e)}")
+        error_location = calculate_popup_center_location(window, popup_width=400, popup_height=150)
+        sg.popup_error(f"Error showing date activity: {str(e)}", title="Error", location=error_location)
+
+def _handle_add_session(event, window, values, state):
+    """Handle add session button in statistics tab"""
+    try:
+        if state.selected_game_for_stats:
+            # Show manual session popup
+            session = show_manual_session_popup(state.selected_game_for_stats, window)
+            if session:
+                # Add session to game
+                success = add_manual_session_to_game(state.selected_game_for_stats, session, state.data_with_indices, state.data_storage)
+                if success:
+                    state.data_changed()
+                    # Save data after adding session
+                    save_data(state.data_with_indices, state.fn, state.data_storage)
+
+                    # Update Discord stats after adding manual session
+                    update_library_stats(state)
+
+                    # Update statistics tab to reflect the new session, keeping the current settings
+                    view = _read_statistics_view(values, state)
+                    view['selected_game'] = state.selected_game_for_stats
+                    draw_statistics_tab(window, state, update_game_list=False, **view)
+                    request_scrollable_refresh(state, '-STATS-COLUMN-')
+
+                    session_added_location = calculate_popup_center_location(window, popup_width=350, popup_height=120)
+                    sg.popup(f"Manual session added to {state.selected_game_for_stats}!", title="Session Added", location=session_added_location)
+                else:
+                    session_error_location = calculate_popup_center_location(window, popup_width=400, popup_height=150)
+                    sg.popup_error(f"Failed to add session to {state.selected_game_for_stats}", title="Error", location=session_error_location)
+        else:
+            no_game_location2 = calculate_popup_center_location(window, popup_width=300, popup_height=120)
+            sg.popup("Please select a game first", title="No Game Selected", icon='gameslisticon.ico', location=no_game_location2)
+    except Exception as e:
+        print(f"Error adding manual session: {str(e)}")
+        error_location2 = calculate_popup_center_location(window, popup_width=400, popup_height=150)
+        sg.popup_error(f"Error adding session: {str(e)}", title="Error", location=error_location2)
+
+def _handle_update_available(event, window, values, state):
+    """Offer the update found by the startup update check"""
+    update_info = values[event]
+    if not update_info:
+        print("No updates found")
+        return
+    print(f"Update found: {update_info.get('version', 'Unknown')}")
+    result = show_update_notification(update_info, parent_window=window)
+    if result == 'download':
+        print("User chose to download and install update")
+        # Handle update process - this should exit the application via sys.exit()
+        try:
+            handle_update_process(update_info, parent_window=window)
+            # If we reach this point, update was cancelled/failed, keep running
+            print("Update process returned normally, continuing")
+        except SystemExit as e:
+            print(f"Update process triggered exit: {e}")
+            cleanup_discord()
+            # Re-raise the SystemExit to ensure we actually exit
+            raise
+        except Exception as e:
+            print(f"Unexpected error during update process: {e}")
+    elif result == 'disable':
+        print("User disabled startup update checks")
+        get_updater().set_check_on_startup_enabled(False)
+    else:
+        print(f"User chose: {result}, continuing")
+
+# Event name -> handler(event, window, values, state)
+EVENT_HANDLERS = {
+    **{menu_event: _handle_menu for menu_event in MENU_EVENTS},
+    '-TABGROUP-': _handle_tab_change,
+    '-REFRESH-CHARTS-': _handle_refresh_charts,
+    '-CHARTS-READY-': _handle_charts_ready,
+    '-STATS-READY-': _handle_stats_ready,
+    '-DATA-CHANGED-': _handle_data_changed,
+    '-REFRESH-STATS-': _handle_refresh_stats,
+    '-CONTRIB-YEAR-PREV-': _handle_year_prev,
+    '-CONTRIB-YEAR-NEXT-': _handle_year_next,
+    '-HEATMAP-WINDOW-SIZE-': _handle_heatmap_window_size,
+    '-DISTRIBUTION-CHART-TYPE-': _handle_distribution_chart_type,
+    '-HEATMAP-PREV-': _handle_heatmap_prev,
+    '-HEATMAP-NEXT-': _handle_heatmap_next,
+    '-HEATMAP-LATEST-': _handle_heatmap_latest,
+    '-HEATMAP-MOST-ACTIVE-': _handle_heatmap_most_active,
+    '-GAME-LIST-': _handle_game_list,
+    '-SHOW-ALL-GAMES-': _handle_show_all_games,
+    '-SESSION-SEARCH-': _handle_session_search,
+    '-SESSION-SEARCH-BTN-': _handle_session_search,
+    **{search_event: _handle_search for search_event in SEARCH_EVENTS},
+    'Reset': _handle_reset,
+    'Save': _handle_save,
+    'Add Entry': _handle_add_entry,
+    '-SESSIONS-TABLE-': _handle_sessions_table,
+    '-VIEW-ALL-NOTES-': _handle_view_all_notes,
+    '-VIEW-DATE-ACTIVITY-': _handle_view_date_activity,
+    '-ADD-SESSION-': _handle_add_session,
+    '-UPDATE-AVAILABLE-': _handle_update_available,
+}
+
+# Element key -> handler for click events, which arrive as tuples: ('-TABLE-', '+CLICKED+', (row, col)).
+# Kept apart from EVENT_HANDLERS because the table's plain '-TABLE-' selection event is not handled.
+CLICK_EVENT_HANDLERS = {
+    '-TABLE-': _handle_table_click,
+}
+
+def get_event_handler(event):
+    """Look up the handler for an event, or None if the event is not handled"""
+    if isinstance(event, tuple):
+        return CLICK_EVENT_HANDLERS.get(event[0])
+    handler = EVENT_HANDLERS.get(event)
+    # The Discord menu item's text changes with its state, so only its key suffix is fixed.
+    # Check the suffix first: keyboard events reach this point on every key press.
+    if handler is None and isinstance(event, str) and event.endswith(DISCORD_TOGGLE_SUFFIX):
+        return _handle_menu
+    return handler
+
 def main():
     """Main entry point for the application"""
-    from utilities import calculate_popup_center_location
-    
     # Load config to get settings
     config = load_config()
     last_file = config.get('last_file')
@@ -76,22 +1020,22 @@ def main():
         data_with_indices = []
         needs_migration = False
         # Create an empty .gmd file in the default location
-        from data_management import save_to_gmd
         save_to_gmd(data_with_indices, fn)
         # Save this as the last used file
-        config['last_file'] = fn
-        save_config(config)
+        if config.get('last_file') != fn:
+            config['last_file'] = fn
+            save_config(config)
     except Exception as e:
         print(f"Unexpected error initializing data: {str(e)}")
         print("Starting with empty database.")
         data_with_indices = []
         needs_migration = False
         # Try to create a new .gmd file
-        from data_management import save_to_gmd
         save_to_gmd(data_with_indices, fn)
         # Save this as the last used file
-        config['last_file'] = fn
-        save_config(config)
+        if config.get('last_file') != fn:
+            config['last_file'] = fn
+            save_config(config)
     
     # Migrate existing data to unified feedback format only if needed
     if data_with_indices and needs_migration:
@@ -104,14 +1048,17 @@ def main():
         
     # Sort the data (if any exists)
     if data_with_indices:
-        data_with_indices = sorted(data_with_indices, key=lambda x: (x[1][1] == "-", x[1][1]))
+        # Games with a release date sorted by it, then games without one ("-") in load order
+        dated = [row for row in data_with_indices if row[1][1] != "-"]
+        undated = [row for row in data_with_indices if row[1][1] == "-"]
+        dated.sort(key=lambda x: x[1][1])
+        data_with_indices = dated + undated
 
     # Initialize Discord Rich Presence with the loaded data
     discord_enabled = config.get('discord_enabled', True)
     discord = initialize_discord(enabled=discord_enabled)
     full_dataset = get_full_dataset(data_with_indices, None)  # No filtering at startup
-    total_games = count_total_entries(full_dataset)
-    completed_games = count_total_completed(full_dataset)
+    total_games, completed_games = count_library_totals(full_dataset)
     print(f"Initial Discord setup: {total_games} games, {completed_games} completed, enabled: {discord_enabled}")
     discord.update_game_library_stats(total_games, completed_games)
     discord.update_presence_browsing('Games List')  # Set initial presence
@@ -119,9 +1066,7 @@ def main():
     # Initialize Auto-Updater
     updater = initialize_updater(check_on_startup=False)  # Don't auto-check yet
     
-    # Check for updates on startup - do this synchronously to control main window creation
-    
-    # First, check if we just completed an update (show success message)
+    # Check if we just completed an update (show success message)
     try:
         update_success_info = updater.check_for_update_success()
         if update_success_info:
@@ -132,41 +1077,7 @@ def main():
     except Exception as e:
         print(f"Error checking for update success: {str(e)}")
     
-    # Then check for new updates if enabled
-    if updater.check_on_startup_enabled:
-        try:
-            print("Checking for updates on startup...")
-            update_info = updater.check_for_updates()
-            if update_info:
-                print(f"Update found: {update_info.get('version', 'Unknown')}")
-                # Show update notification (no parent window during startup)
-                result = show_update_notification(update_info, parent_window=None)
-                if result == 'download':
-                    print("User chose to download and install update")
-                    # Handle update process - this should exit the application via sys.exit()
-                    try:
-                        handle_update_process(update_info, parent_window=None)
-                        # If we reach this point, update was cancelled/failed, continue with startup
-                        print("Update process returned normally, continuing with startup")
-                    except SystemExit as e:
-                        print(f"Update process triggered exit: {e}")
-                        # Re-raise the SystemExit to ensure we actually exit
-                        raise
-                    except Exception as e:
-                        print(f"Unexpected error during update process: {e}")
-                        # Continue with startup if there was an error
-                elif result == 'disable':
-                    print("User disabled startup update checks")
-                    updater.set_check_on_startup_enabled(False)
-                else:
-                    print(f"User chose: {result}, continuing with startup")
-            else:
-                print("No updates found, continuing with startup")
-        except Exception as e:
-            print(f"Error during startup update check: {str(e)}, continuing with startup")
-    
-    # If we reach this point, either no update was needed or update was cancelled/failed
-    # Continue with normal startup and create main window
+    # New updates are checked for in the background once the main window is up
     
     # Set up update callback for manual update checks (menu-driven)
     def update_notification_callback(update_info):
@@ -186,800 +1097,40 @@ def main():
     window = sg.Window(f'Games List Manager - {os.path.basename(fn)}', layout, 
                       resizable=True, return_keyboard_events=True, finalize=True, 
                       icon='gameslisticon.ico', size=(1300, 700))
-    window['-TABGROUP-'].Widget.select(0)  # Ensure first tab is selected by default
+    # The layout only inserts the first rows of the table; the rest load as it is scrolled
+    set_table_data(window['-TABLE-'], data_with_indices)
 
-    # Track which tabs have been loaded
-    tabs_loaded = {0: True, 1: False, 2: False}
+    # State shared with the event handlers
+    state = AppState(data_with_indices, fn, discord)
 
-    # State for sorting direction
-    sort_directions = {i: True for i in range(8)}  # 8 columns
-
-    # Variables for data management
-    data_storage = None  # For storing complete dataset when filtering
-    selected_game_for_stats = None
-    
-    # Heatmap navigation state
-    main.heatmap_end_date = None  # Track current heatmap end date for navigation
+    # Check for new updates without holding up the window; the result arrives as an -UPDATE-AVAILABLE- event
+    if updater.check_on_startup_enabled:
+        print("Checking for updates on startup...")
+        updater.check_for_updates_async(lambda update_info: window.write_event_value('-UPDATE-AVAILABLE-', update_info))
 
     # Event loop
     while True:
-        event, values = window.read()
+        # Only wake up on a timer while a debounced update is waiting
+        timeout = DEBOUNCE_POLL_MS if state.has_pending_updates() else None
+        event, values = window.read(timeout=timeout)
         
         if event == sg.WIN_CLOSED or event == 'Exit':
             # Cleanup Discord before exiting
             cleanup_discord()
             break
-            
-        # Handle menu events
-        elif (event in ['Open', 'Save As', 'Import from Excel', 'User Guide', 
-                       'Feature Tour', 'Data Format Info', 'Troubleshooting', 
-                       'Check for Updates', 'Update Settings', 'Release Notes', 'Report Bug', 'About',
-                       'View Activity by Date', 'Today\'s Activity', 'Yesterday\'s Activity'] or 
-              (isinstance(event, str) and event.startswith('Discord:') and event.endswith('::discord_toggle'))):
-            result = handle_menu_events(event, window, data_with_indices, fn)
-            if result:
-                if result.get('action') == 'file_loaded':
-                    data_with_indices = result['data']
-                    fn = result['filename']
-                    data_storage = None  # Reset data storage
-                    
-                    # Update Discord with new file stats
-                    full_dataset = get_full_dataset(data_with_indices, data_storage)
-                    total_games = count_total_entries(full_dataset)
-                    completed_games = count_total_completed(full_dataset)
-                    discord.update_game_library_stats(total_games, completed_games)
-                    
-                    # Map tab key to tab name for Discord
-                    current_tab_key = values['-TABGROUP-']
-                    tab_name_map = {'-TAB1-': 'Games List', '-TAB2-': 'Summary', '-TAB3-': 'Statistics'}
-                    current_tab = tab_name_map.get(current_tab_key, 'Games List')
-                    discord.update_presence_browsing(current_tab)
-                    
-                    from ui_components import update_table_display
-                    update_table_display(data_with_indices, window)
-                    update_summary(data_with_indices, window)
-                    if values['-TABGROUP-'] == '-TAB2-':
-                        update_summary_charts(data_with_indices)
-                        # Update charts after loading data
-                        charts = update_summary_charts(data_with_indices)
-                        if charts:
-                            window['-PIE-CHART-'].update(filename=charts['pie_chart'])
-                            window['-YEAR-CHART-'].update(filename=charts['year_chart'])
-                            window['-PLAYTIME-CHART-'].update(filename=charts['playtime_chart'])
-                            window['-RATING-CHART-'].update(filename=charts['rating_chart'])
-                            force_scrollable_refresh(window)
-                    elif values['-TABGROUP-'] == '-TAB3-':
-                        full_dataset = get_full_dataset(data_with_indices, data_storage)
-                        update_statistics_tab(window, data_with_indices, selected_game=None, update_game_list=True, full_dataset=full_dataset)
-                        force_scrollable_refresh(window)
-                elif result.get('action') == 'file_saved':
-                    fn = result['filename']
-                elif result.get('action') == 'file_converted':
-                    data_with_indices = result['data']
-                    fn = result['filename']
-                    data_storage = None  # Reset data storage
-                    
-                    # Update Discord with converted file stats
-                    full_dataset = get_full_dataset(data_with_indices, data_storage)
-                    total_games = count_total_entries(full_dataset)
-                    completed_games = count_total_completed(full_dataset)
-                    discord.update_game_library_stats(total_games, completed_games)
-                    
-                    # Map tab key to tab name for Discord
-                    current_tab_key = values['-TABGROUP-']
-                    tab_name_map = {'-TAB1-': 'Games List', '-TAB2-': 'Summary', '-TAB3-': 'Statistics'}
-                    current_tab = tab_name_map.get(current_tab_key, 'Games List')
-                    discord.update_presence_browsing(current_tab)
-                    
-                    from ui_components import update_table_display
-                    update_table_display(data_with_indices, window)
-                    update_summary(data_with_indices, window)
-                    if values['-TABGROUP-'] == '-TAB2-':
-                        charts = update_summary_charts(data_with_indices)
-                        if charts:
-                            window['-PIE-CHART-'].update(filename=charts['pie_chart'])
-                            window['-YEAR-CHART-'].update(filename=charts['year_chart'])
-                            window['-PLAYTIME-CHART-'].update(filename=charts['playtime_chart'])
-                            window['-RATING-CHART-'].update(filename=charts['rating_chart'])
-                            force_scrollable_refresh(window)
-                    elif values['-TABGROUP-'] == '-TAB3-':
-                        full_dataset = get_full_dataset(data_with_indices, data_storage)
-                        update_statistics_tab(window, data_with_indices, selected_game=None, update_game_list=True, full_dataset=full_dataset)
-                        force_scrollable_refresh(window)
-                        
-        # Handle tab changes
-        elif event == '-TABGROUP-':  # Tab changed
-            current_tab_key = values['-TABGROUP-']
-            
-            # Map tab keys to actual tab names
-            tab_name_map = {
-                '-TAB1-': 'Games List',
-                '-TAB2-': 'Summary', 
-                '-TAB3-': 'Statistics'
-            }
-            current_tab = tab_name_map.get(current_tab_key, current_tab_key)
-            
-            # Debug: print tab change information
-            print(f"Main: Tab changed to '{current_tab}' (key: '{current_tab_key}')")
-            
-            # Update Discord presence based on tab - also update game stats
-            full_dataset = get_full_dataset(data_with_indices, data_storage)
-            total_games = count_total_entries(full_dataset)
-            completed_games = count_total_completed(full_dataset)
-            print(f"Main: Updating Discord with {total_games} games, {completed_games} completed")
-            discord.update_game_library_stats(total_games, completed_games)
-            discord.update_presence_browsing(current_tab)
-            
-            if current_tab_key == '-TAB2-' and not tabs_loaded[1]:
-                # First time loading the Summary tab - generate charts
-                charts = update_summary_charts(data_with_indices)
-                if charts:
-                    window['-PIE-CHART-'].update(filename=charts['pie_chart'])
-                    window['-YEAR-CHART-'].update(filename=charts['year_chart'])
-                    window['-PLAYTIME-CHART-'].update(filename=charts['playtime_chart'])
-                    window['-RATING-CHART-'].update(filename=charts['rating_chart'])
-                    force_scrollable_refresh(window)
-                tabs_loaded[1] = True
-            elif current_tab_key == '-TAB3-' and not tabs_loaded[2]:
-                # First time loading the Statistics tab - update statistics
-                from event_handlers import update_statistics_tab
-                
-                # Initialize year display to current year or latest data year
-                from datetime import datetime
-                current_year = datetime.now().year
-                window['-CONTRIB-YEAR-DISPLAY-'].update(str(current_year))
-                
-                full_dataset = get_full_dataset(data_with_indices, data_storage)
-                update_statistics_tab(window, data_with_indices, selected_game=None, update_game_list=True, full_dataset=full_dataset)
-                force_scrollable_refresh(window)
-                tabs_loaded[2] = True
-                
-        # Handle chart refresh
-        elif event == '-REFRESH-CHARTS-':
-            charts = update_summary_charts(data_with_indices)
-            if charts:
-                window['-PIE-CHART-'].update(filename=charts['pie_chart'])
-                window['-YEAR-CHART-'].update(filename=charts['year_chart'])
-                window['-PLAYTIME-CHART-'].update(filename=charts['playtime_chart'])
-                window['-RATING-CHART-'].update(filename=charts['rating_chart'])
-                force_scrollable_refresh(window)
-                
-        # Handle statistics refresh
-        elif event == '-REFRESH-STATS-':
-            from event_handlers import update_statistics_tab
-            # Get currently selected game if any
-            selected_game = None
-            if values['-GAME-LIST-']:
-                selected_game = values['-GAME-LIST-'][0]
-            update_statistics_tab(window, data_with_indices, selected_game)
-            
-        # Handle contributions year navigation
-        elif event == '-CONTRIB-YEAR-PREV-':
-            try:
-                current_year = int(window['-CONTRIB-YEAR-DISPLAY-'].get())
-                new_year = current_year - 1
-                window['-CONTRIB-YEAR-DISPLAY-'].update(str(new_year))
-                
-                # Refresh contributions map with new year
-                from event_handlers import update_statistics_tab
-                selected_game = None
-                if values['-GAME-LIST-']:
-                    selected_game = values['-GAME-LIST-'][0]
-                update_statistics_tab(window, data_with_indices, selected_game, update_game_list=False, contributions_year=new_year)
-            except Exception as e:
-                print(f"Error changing year: {str(e)}")
-                
-        elif event == '-CONTRIB-YEAR-NEXT-':
-            try:
-                current_year = int(window['-CONTRIB-YEAR-DISPLAY-'].get())
-                new_year = current_year + 1
-                window['-CONTRIB-YEAR-DISPLAY-'].update(str(new_year))
-                
-                # Refresh contributions map with new year
-                from event_handlers import update_statistics_tab
-                selected_game = None
-                if values['-GAME-LIST-']:
-                    selected_game = values['-GAME-LIST-'][0]
-                update_statistics_tab(window, data_with_indices, selected_game, update_game_list=False, contributions_year=new_year)
-            except Exception as e:
-                print(f"Error changing year: {str(e)}")
-
-        # Handle heatmap window size change
-        elif event == '-HEATMAP-WINDOW-SIZE-':
-            try:
-                from event_handlers import update_statistics_tab
-                from datetime import datetime
-                
-                # Convert window size to months
-                window_text = values['-HEATMAP-WINDOW-SIZE-']
-                window_months = {'1 Month': 1, '3 Months': 3, '6 Months': 6, '1 Year': 12}.get(window_text, 1)
-                
-                # Get current selected game
-                selected_game = None
-                if values['-GAME-LIST-']:
-                    selected_game = values['-GAME-LIST-'][0]
-                
-                # Get current contributions year
-                contributions_year = None
-                try:
-                    contributions_year = int(window['-CONTRIB-YEAR-DISPLAY-'].get())
-                except:
-                    contributions_year = datetime.now().year
-                
-                # Update heatmap with new window size
-                update_statistics_tab(window, data_with_indices, selected_game, 
-                                    update_game_list=False, contributions_year=contributions_year,
-                                    heatmap_window_months=window_months)
-            except Exception as e:
-                print(f"Error changing heatmap window size: {str(e)}")
-
-        # Handle distribution chart type change
-        elif event == '-DISTRIBUTION-CHART-TYPE-':
-            try:
-                from event_handlers import update_statistics_tab
-                from datetime import datetime
-                
-                # Convert chart type text to parameter
-                chart_type_text = values['-DISTRIBUTION-CHART-TYPE-']
-                chart_type_map = {
-                    'Line Chart': 'line',
-                    'Scatter Plot': 'scatter', 
-                    'Box Plot': 'box',
-                    'Histogram': 'histogram'
-                }
-                chart_type = chart_type_map.get(chart_type_text, 'line')
-                
-                # Get current selected game
-                selected_game = None
-                if values['-GAME-LIST-']:
-                    selected_game = values['-GAME-LIST-'][0]
-                
-                # Get current contributions year and heatmap settings
-                contributions_year = None
-                try:
-                    contributions_year = int(window['-CONTRIB-YEAR-DISPLAY-'].get())
-                except:
-                    contributions_year = datetime.now().year
-                
-                window_text = values.get('-HEATMAP-WINDOW-SIZE-', '1 Month')
-                window_months = {'1 Month': 1, '3 Months': 3, '6 Months': 6, '1 Year': 12}.get(window_text, 1)
-                
-                heatmap_end_date = getattr(main, 'heatmap_end_date', None)
-                
-                # Update statistics with new chart type
-                update_statistics_tab(window, data_with_indices, selected_game, 
-                                    update_game_list=False, contributions_year=contributions_year,
-                                    heatmap_window_months=window_months, heatmap_end_date=heatmap_end_date,
-                                    distribution_chart_type=chart_type)
-            except Exception as e:
-                print(f"Error changing distribution chart type: {str(e)}")
-                import traceback
-                traceback.print_exc()
-                
-        # Handle heatmap navigation
-        elif event == '-HEATMAP-PREV-':
-            try:
-                from event_handlers import update_statistics_tab
-                from session_management import extract_all_sessions
-                from datetime import datetime, timedelta
-                
-                # Get current window size
-                window_text = values['-HEATMAP-WINDOW-SIZE-']
-                window_months = {'1 Month': 1, '3 Months': 3, '6 Months': 6, '1 Year': 12}.get(window_text, 1)
-                
-                # Get current end date from the display or use current date
-                current_period = window['-HEATMAP-PERIOD-DISPLAY-'].get()
-                
-                # Calculate new end date (move back by window size)
-                if hasattr(main, 'heatmap_end_date') and main.heatmap_end_date:
-                    new_end_date = main.heatmap_end_date - timedelta(days=window_months * 30)
-                else:
-                    # First time navigating, start from current date
-                    new_end_date = datetime.now().date() - timedelta(days=window_months * 30)
-                
-                # Store the new end date
-                main.heatmap_end_date = new_end_date
-                
-                # Get current selected game and contributions year
-                selected_game = None
-                if values['-GAME-LIST-']:
-                    selected_game = values['-GAME-LIST-'][0]
-                
-                contributions_year = None
-                try:
-                    contributions_year = int(window['-CONTRIB-YEAR-DISPLAY-'].get())
-                except:
-                    contributions_year = datetime.now().year
-                
-                # Update heatmap with new date range
-                update_statistics_tab(window, data_with_indices, selected_game,
-                                    update_game_list=False, contributions_year=contributions_year,
-                                    heatmap_window_months=window_months, heatmap_end_date=new_end_date)
-            except Exception as e:
-                print(f"Error navigating heatmap backwards: {str(e)}")
-                
-        elif event == '-HEATMAP-NEXT-':
-            try:
-                from event_handlers import update_statistics_tab
-                from datetime import datetime, timedelta
-                
-                # Get current window size
-                window_text = values['-HEATMAP-WINDOW-SIZE-']
-                window_months = {'1 Month': 1, '3 Months': 3, '6 Months': 6, '1 Year': 12}.get(window_text, 1)
-                
-                # Calculate new end date (move forward by window size)
-                if hasattr(main, 'heatmap_end_date') and main.heatmap_end_date:
-                    new_end_date = main.heatmap_end_date + timedelta(days=window_months * 30)
-                else:
-                    # First time navigating, start from current date
-                    new_end_date = datetime.now().date()
-                
-                # Don't go beyond current date
-                if new_end_date > datetime.now().date():
-                    new_end_date = datetime.now().date()
-                
-                # Store the new end date
-                main.heatmap_end_date = new_end_date
-                
-                # Get current selected game and contributions year
-                selected_game = None
-                if values['-GAME-LIST-']:
-                    selected_game = values['-GAME-LIST-'][0]
-                
-                contributions_year = None
-                try:
-                    contributions_year = int(window['-CONTRIB-YEAR-DISPLAY-'].get())
-                except:
-                    contributions_year = datetime.now().year
-                
-                # Update heatmap with new date range
-                update_statistics_tab(window, data_with_indices, selected_game,
-                                    update_game_list=False, contributions_year=contributions_year,
-                                    heatmap_window_months=window_months, heatmap_end_date=new_end_date)
-            except Exception as e:
-                print(f"Error navigating heatmap forwards: {str(e)}")
-                
-        elif event == '-HEATMAP-LATEST-':
-            try:
-                from event_handlers import update_statistics_tab
-                from datetime import datetime
-                
-                # Reset to latest data (current date)
-                main.heatmap_end_date = None  # Reset to use latest data
-                
-                # Get current window size
-                window_text = values['-HEATMAP-WINDOW-SIZE-']
-                window_months = {'1 Month': 1, '3 Months': 3, '6 Months': 6, '1 Year': 12}.get(window_text, 1)
-                
-                # Get current selected game and contributions year
-                selected_game = None
-                if values['-GAME-LIST-']:
-                    selected_game = values['-GAME-LIST-'][0]
-                
-                contributions_year = None
-                try:
-                    contributions_year = int(window['-CONTRIB-YEAR-DISPLAY-'].get())
-                except:
-                    contributions_year = datetime.now().year
-                
-                # Update heatmap to latest period
-                update_statistics_tab(window, data_with_indices, selected_game,
-                                    update_game_list=False, contributions_year=contributions_year,
-                                    heatmap_window_months=window_months, heatmap_end_date=None)
-            except Exception as e:
-                print(f"Error jumping to latest heatmap period: {str(e)}")
-                
-        elif event == '-HEATMAP-MOST-ACTIVE-':
-            try:
-                from event_handlers import update_statistics_tab
-                from session_management import extract_all_sessions, get_game_sessions, find_most_active_period
-                from datetime import datetime
-                
-                # Get current window size
-                window_text = values['-HEATMAP-WINDOW-SIZE-']
-                window_months = {'1 Month': 1, '3 Months': 3, '6 Months': 6, '1 Year': 12}.get(window_text, 1)
-                
-                # Get sessions to analyze
-                selected_game = None
-                if values['-GAME-LIST-']:
-                    selected_game = values['-GAME-LIST-'][0]
-                    sessions = get_game_sessions(data_with_indices, selected_game)
-                else:
-                    sessions = extract_all_sessions(data_with_indices)
-                
-                # Find most active period
-                most_active_end_date = find_most_active_period(sessions, window_months)
-                main.heatmap_end_date = most_active_end_date
-                
-                # Get current contributions year
-                contributions_year = None
-                try:
-                    contributions_year = int(window['-CONTRIB-YEAR-DISPLAY-'].get())
-                except:
-                    contributions_year = datetime.now().year
-                
-                # Update heatmap to most active period
-                update_statistics_tab(window, data_with_indices, selected_game,
-                                    update_game_list=False, contributions_year=contributions_year,
-                                    heatmap_window_months=window_months, heatmap_end_date=most_active_end_date)
-            except Exception as e:
-                print(f"Error jumping to most active heatmap period: {str(e)}")
-
-        # Handle game list selection in Statistics tab
-        elif event == '-GAME-LIST-':
-            try:
-                if values['-GAME-LIST-'] and len(values['-GAME-LIST-']) > 0:
-                    selected_game_for_stats = values['-GAME-LIST-'][0]
-                    
-                    # Get current chart type selection
-                    chart_type_text = values.get('-DISTRIBUTION-CHART-TYPE-', 'Line Chart')
-                    chart_type_map = {
-                        'Line Chart': 'line',
-                        'Scatter Plot': 'scatter', 
-                        'Box Plot': 'box',
-                        'Histogram': 'histogram'
-                    }
-                    chart_type = chart_type_map.get(chart_type_text, 'line')
-                    
-                    # Get other current settings
-                    from datetime import datetime
-                    contributions_year = None
-                    try:
-                        contributions_year = int(window['-CONTRIB-YEAR-DISPLAY-'].get())
-                    except:
-                        contributions_year = datetime.now().year
-                    
-                    window_text = values.get('-HEATMAP-WINDOW-SIZE-', '1 Month')
-                    window_months = {'1 Month': 1, '3 Months': 3, '6 Months': 6, '1 Year': 12}.get(window_text, 1)
-                    
-                    heatmap_end_date = getattr(main, 'heatmap_end_date', None)
-                    
-                    update_statistics_tab(window, data_with_indices, selected_game_for_stats, 
-                                        update_game_list=False, contributions_year=contributions_year,
-                                        heatmap_window_months=window_months, heatmap_end_date=heatmap_end_date,
-                                        distribution_chart_type=chart_type)
-                    force_scrollable_refresh(window)
-            except Exception as e:
-                print(f"Error handling game selection: {str(e)}")
-                sg.popup_error(f"Error selecting game: {str(e)}", title="Error")
-                
-        # Handle show all games button
-        elif event == '-SHOW-ALL-GAMES-':
-            from event_handlers import update_statistics_tab
-            
-            # Get current chart type selection
-            chart_type_text = values.get('-DISTRIBUTION-CHART-TYPE-', 'Line Chart')
-            chart_type_map = {
-                'Line Chart': 'line',
-                'Scatter Plot': 'scatter', 
-                'Box Plot': 'box',
-                'Histogram': 'histogram'
-            }
-            chart_type = chart_type_map.get(chart_type_text, 'line')
-            
-            selected_game_for_stats = None
-            window['-GAME-LIST-'].update(set_to_index=[])  # Clear selection in listbox
-            
-            # Clear selected game from Discord tracking and update to general stats
-            discord.update_presence_viewing_stats(None)
-            
-            full_dataset = get_full_dataset(data_with_indices, data_storage)
-            update_statistics_tab(window, data_with_indices, selected_game=None, update_game_list=True,
-                                distribution_chart_type=chart_type, full_dataset=full_dataset)
-            force_scrollable_refresh(window)
-            
-        # Handle session search
-        elif event == '-SESSION-SEARCH-':
-            search_query = values['-SESSION-SEARCH-'].lower()
-            game_names = []
-            # Use original dataset if available, otherwise use current filtered view
-            search_data = data_storage if data_storage is not None else data_with_indices
-            for idx, game_data in search_data:
-                game_name = game_data[0]
-                has_sessions = len(game_data) > 7 and game_data[7] and len(game_data[7]) > 0
-                has_status_history = len(game_data) > 8 and game_data[8] and len(game_data[8]) > 0
-                if (has_sessions or has_status_history) and (not search_query or search_query in game_name.lower()):
-                    game_names.append(game_name)
-            window['-GAME-LIST-'].update(values=sorted(game_names))
-            
-        elif event == '-SESSION-SEARCH-BTN-':
-            search_query = values['-SESSION-SEARCH-'].lower()
-            game_names = []
-            # Use original dataset if available, otherwise use current filtered view
-            search_data = data_storage if data_storage is not None else data_with_indices
-            for idx, game_data in search_data:
-                game_name = game_data[0]
-                has_sessions = len(game_data) > 7 and game_data[7] and len(game_data[7]) > 0
-                has_status_history = len(game_data) > 8 and game_data[8] and len(game_data[8]) > 0
-                if (has_sessions or has_status_history) and (not search_query or search_query in game_name.lower()):
-                    game_names.append(game_name)
-            window['-GAME-LIST-'].update(values=sorted(game_names))
-            
-        # Handle search and reset
-        elif event == 'Search' or event in ['\r', QT_ENTER_KEY1, QT_ENTER_KEY2]:
-            query = values['-SEARCH-'].lower().strip()
-            if data_storage is None:  # save the whole dataset once before filtering
-                data_storage = data_with_indices.copy()
-            
-            # Always filter from the original dataset (data_storage), not from current filtered view
-            # This prevents nested filtering where each new search filters the already filtered results
-            if not query:
-                # If query is empty, show all entries
-                data_with_indices = data_storage.copy()
-            else:
-                data_with_indices = [row for row in data_storage if any(query in str(cell).lower() for cell in row[1])]
-            
-            from ui_components import update_table_display
-            update_table_display(data_with_indices, window)
-            update_summary(data_with_indices, window)
-            
-        elif event == 'Reset':
-            if data_storage is not None:
-                # Restore original data but reset indices
-                data_with_indices = data_storage.copy()
-                # Reset indices to avoid duplication
-                data_with_indices = [(i, row[1]) for i, row in enumerate(data_with_indices)]
-                data_storage = None
-            from ui_components import update_table_display
-            update_table_display(data_with_indices, window)
-            window['-SEARCH-'].update('')
-            update_summary(data_with_indices, window)
-            
-        # Handle save
-        elif event == 'Save':
-            save_data(data_with_indices, fn, data_storage)
-            from event_handlers import update_window_title
-            update_window_title(window, fn)
-            save_location = calculate_popup_center_location(window, popup_width=500, popup_height=200)
-            sg.popup(f'Data manually saved to {fn}!\n\nNote: Most operations now auto-save. Manual save is mainly needed for search/filter changes or as backup.', title='Manual Save Confirmation', location=save_location)
-            
-        # Handle add entry
-        elif event == 'Add Entry':
-            result = handle_add_entry(data_with_indices, window, fn, data_storage)
-            if result and result.get('action') == 'entry_added':
-                data_with_indices = result['data']
-                
-                # Update Discord stats after adding entry
-                full_dataset = get_full_dataset(data_with_indices, data_storage)
-                total_games = count_total_entries(full_dataset)
-                completed_games = count_total_completed(full_dataset)
-                discord.update_game_library_stats(total_games, completed_games)
-                discord.update_presence_browsing(values['-TABGROUP-'])
-                
-                from ui_components import update_table_display
-                update_table_display(data_with_indices, window)
-                update_summary(data_with_indices, window)
-                
-        # Handle table events
-        elif isinstance(event, tuple) and event[0] == '-TABLE-':
-
-            result = handle_table_event(event, data_with_indices, window, sort_directions, fn, data_storage)
-            if result:
-                if isinstance(result, list):  # Sorted data returned
-                    data_with_indices = result
-                elif isinstance(result, dict) and result.get('action') == 'show_actions':
-                    action_result = handle_game_action(
-                        result['row_index'], data_with_indices, window, 
-                        data_storage, fn
-                    )
-
-                    if action_result:
-                        if action_result.get('action') == 'view_statistics':
-                            # Switch to Statistics tab and pre-select the game
-                            game_name = action_result['game_name']
-                            data_with_indices = action_result['data']
-                            
-                            # Switch to Statistics tab (index 2)
-                            window['-TABGROUP-'].Widget.select(2)
-                            
-                            # Update tab tracking
-                            if not tabs_loaded[2]:
-                                from datetime import datetime
-                                current_year = datetime.now().year
-                                window['-CONTRIB-YEAR-DISPLAY-'].update(str(current_year))
-                                tabs_loaded[2] = True
-                            
-                            # Update statistics tab with all games first to populate the list
-                            from event_handlers import update_statistics_tab
-                            full_dataset = get_full_dataset(data_with_indices, data_storage)
-                            update_statistics_tab(window, data_with_indices, selected_game=None, update_game_list=True, full_dataset=full_dataset)
-                            
-                            # Get the game list to find the index of our target game
-                            game_list_values = window['-GAME-LIST-'].Values
-                            
-                            # Find the game in the list and select it
-                            if game_name in game_list_values:
-                                game_index = game_list_values.index(game_name)
-                                window['-GAME-LIST-'].update(set_to_index=[game_index], scroll_to_index=game_index)
-                                
-                                # Update the selected game variable for other features like "View Activity Log"
-                                selected_game_for_stats = game_name
-                                
-                                # Update statistics tab with the selected game
-                                update_statistics_tab(window, data_with_indices, selected_game=game_name, update_game_list=False)
-                                
-                                # Update Discord presence for viewing stats
-                                discord.update_presence_viewing_stats(game_name)
-                            else:
-                                # Game doesn't have sessions/statistics data, show message
-                                stats_location = calculate_popup_center_location(window, popup_width=400, popup_height=150)
-                                sg.popup(f"'{game_name}' doesn't have any session data or statistics to display.", 
-                                        title="No Statistics Available", icon='gameslisticon.ico', location=stats_location)
-                                # Switch back to Games List tab
-                                window['-TABGROUP-'].Widget.select(0)
-                            
-                            force_scrollable_refresh(window)
-                            
-                        elif action_result.get('action') in ['game_edited', 'game_deleted', 'game_rated', 'time_tracked', 'session_added']:
-                            data_with_indices = action_result['data']
-                            
-                            # Update Discord stats after game actions
-                            full_dataset = get_full_dataset(data_with_indices, data_storage)
-                            total_games = count_total_entries(full_dataset)
-                            completed_games = count_total_completed(full_dataset)
-                            discord.update_game_library_stats(total_games, completed_games)
-                            
-                            # Map tab key to tab name for Discord
-                            current_tab_key = values['-TABGROUP-']
-                            tab_name_map = {'-TAB1-': 'Games List', '-TAB2-': 'Summary', '-TAB3-': 'Statistics'}
-                            current_tab = tab_name_map.get(current_tab_key, 'Games List')
-                            discord.update_presence_browsing(current_tab)
-                            
-                            from ui_components import update_table_display
-                            update_table_display(data_with_indices, window)
-                            update_summary(data_with_indices, window)
-                            # Update charts if on summary tab
-                            if values['-TABGROUP-'] == '-TAB2-':
-                                charts = update_summary_charts(data_with_indices)
-                                if charts:
-                                    window['-PIE-CHART-'].update(filename=charts['pie_chart'])
-                                    window['-YEAR-CHART-'].update(filename=charts['year_chart'])
-                                    window['-PLAYTIME-CHART-'].update(filename=charts['playtime_chart'])
-                                    window['-RATING-CHART-'].update(filename=charts['rating_chart'])
-                                    force_scrollable_refresh(window)
-                            # Update statistics tab if it's currently active
-                            elif values['-TABGROUP-'] == '-TAB3-':
-                                from event_handlers import update_statistics_tab
-                                from datetime import datetime
-                                
-                                # Get current selected game from statistics tab if available
-                                selected_game = None
-                                if values['-GAME-LIST-']:
-                                    selected_game = values['-GAME-LIST-'][0]
-                                
-                                # Get current settings
-                                chart_type_text = values.get('-DISTRIBUTION-CHART-TYPE-', 'Line Chart')
-                                chart_type_map = {
-                                    'Line Chart': 'line',
-                                    'Scatter Plot': 'scatter', 
-                                    'Box Plot': 'box',
-                                    'Histogram': 'histogram'
-                                }
-                                chart_type = chart_type_map.get(chart_type_text, 'line')
-                                
-                                contributions_year = None
-                                try:
-                                    contributions_year = int(window['-CONTRIB-YEAR-DISPLAY-'].get())
-                                except:
-                                    contributions_year = datetime.now().year
-                                
-                                window_text = values.get('-HEATMAP-WINDOW-SIZE-', '1 Month')
-                                window_months = {'1 Month': 1, '3 Months': 3, '6 Months': 6, '1 Year': 12}.get(window_text, 1)
-                                heatmap_end_date = getattr(main, 'heatmap_end_date', None)
-                                
-                                full_dataset = get_full_dataset(data_with_indices, data_storage)
-                                update_statistics_tab(window, data_with_indices, selected_game, 
-                                                    update_game_list=True, contributions_year=contributions_year,
-                                                    heatmap_window_months=window_months, heatmap_end_date=heatmap_end_date,
-                                                    distribution_chart_type=chart_type, full_dataset=full_dataset)
-                                force_scrollable_refresh(window)
-                                    
-
-
-                        
-
-        # Handle session table clicks
-        elif event == '-SESSIONS-TABLE-' and values['-SESSIONS-TABLE-']:
-            result = handle_session_table_click(
-                values, selected_game_for_stats, data_with_indices, window, fn, data_storage
-            )
-            # The statistics tab will be updated within the handler if needed
-            
-        # Handle view all notes button
-        elif event == '-VIEW-ALL-NOTES-':
-            try:
-                from session_management import get_game_sessions
-                if selected_game_for_stats:
-                    game_sessions = get_game_sessions(data_with_indices, selected_game_for_stats)
-                    display_all_game_notes(selected_game_for_stats, game_sessions, data_with_indices, window)
-                else:
-                    no_game_location = calculate_popup_center_location(window, popup_width=300, popup_height=120)
-                    sg.popup("Please select a game first", title="No Game Selected", icon='gameslisticon.ico', location=no_game_location)
-            except Exception as e:
-                print(f"Error displaying all notes: {str(e)}")
-                error_location = calculate_popup_center_location(window, popup_width=400, popup_height=150)
-                sg.popup_error(f"Error displaying notes: {str(e)}", title="Error", location=error_location)
-                
-        # Handle view date activity button
-        elif event == '-VIEW-DATE-ACTIVITY-':
-            try:
-                from date_activity_view import show_date_picker_dialog, show_date_activity_view
-                # Show date picker dialog
-                selected_date = show_date_picker_dialog(window)
-                if selected_date:
-                    # Get full dataset to include all activities, not just filtered view
-                    full_dataset = get_full_dataset(data_with_indices, data_storage)
-                    # Show activity view for the selected date
-                    show_date_activity_view(selected_date, full_dataset, window)
-            except Exception as e:
-                print(f"Error showing date activity view: {str(e)}")
-                error_location = calculate_popup_center_location(window, popup_width=400, popup_height=150)
-                sg.popup_error(f"Error showing date activity: {str(e)}", title="Error", location=error_location)
-                
-        # Handle add session button in statistics tab
-        elif event == '-ADD-SESSION-':
-            try:
-                from session_management import show_manual_session_popup, add_manual_session_to_game
-                if selected_game_for_stats:
-                    # Show manual session popup
-                    session = show_manual_session_popup(selected_game_for_stats, window)
-                    if session:
-                        # Add session to game
-                        success = add_manual_session_to_game(selected_game_for_stats, session, data_with_indices, data_storage)
-                        if success:
-                            # Save data after adding session
-                            save_data(data_with_indices, fn, data_storage)
-                            
-                            # Update Discord stats after adding manual session
-                            full_dataset = get_full_dataset(data_with_indices, data_storage)
-                            total_games = count_total_entries(full_dataset)
-                            completed_games = count_total_completed(full_dataset)
-                            discord.update_game_library_stats(total_games, completed_games)
-                            
-                            # Update statistics tab to reflect the new session
-                            from event_handlers import update_statistics_tab
-                            from datetime import datetime
-                            
-                            # Get current settings
-                            chart_type_text = values.get('-DISTRIBUTION-CHART-TYPE-', 'Line Chart')
-                            chart_type_map = {
-                                'Line Chart': 'line',
-                                'Scatter Plot': 'scatter', 
-                                'Box Plot': 'box',
-                                'Histogram': 'histogram'
-                            }
-                            chart_type = chart_type_map.get(chart_type_text, 'line')
-                            
-                            contributions_year = None
-                            try:
-                                contributions_year = int(window['-CONTRIB-YEAR-DISPLAY-'].get())
-                            except:
-                                contributions_year = datetime.now().year
-                            
-                            window_text = values.get('-HEATMAP-WINDOW-SIZE-', '1 Month')
-                            window_months = {'1 Month': 1, '3 Months': 3, '6 Months': 6, '1 Year': 12}.get(window_text, 1)
-                            heatmap_end_date = getattr(main, 'heatmap_end_date', None)
-                            
-                            update_statistics_tab(window, data_with_indices, selected_game_for_stats, 
-                                                update_game_list=False, contributions_year=contributions_year,
-                                                heatmap_window_months=window_months, heatmap_end_date=heatmap_end_date,
-                                                distribution_chart_type=chart_type)
-                            force_scrollable_refresh(window)
-                            
-                            session_added_location = calculate_popup_center_location(window, popup_width=350, popup_height=120)
-                            sg.popup(f"Manual session added to {selected_game_for_stats}!", title="Session Added", location=session_added_location)
-                        else:
-                            session_error_location = calculate_popup_center_location(window, popup_width=400, popup_height=150)
-                            sg.popup_error(f"Failed to add session to {selected_game_for_stats}", title="Error", location=session_error_location)
-                else:
-                    no_game_location2 = calculate_popup_center_location(window, popup_width=300, popup_height=120)
-                    sg.popup("Please select a game first", title="No Game Selected", icon='gameslisticon.ico', location=no_game_location2)
-            except Exception as e:
-                print(f"Error adding manual session: {str(e)}")
-                error_location2 = calculate_popup_center_location(window, popup_width=400, popup_height=150)
-                sg.popup_error(f"Error adding session: {str(e)}", title="Error", location=error_location2)
+        
+        handler = get_event_handler(event)
+        if handler:
+            handler(event, window, values, state)
+
+        run_pending_table_sort(window, values, state)
+        run_pending_statistics_update(window, state)
+        run_pending_session_search(window, state)
+        run_pending_scrollable_refresh(window, state)
 
     window.close()
+    # Don't start queued chart renders for a window that is gone
+    _charts_executor.shutdown(wait=False, cancel_futures=True)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main() 
@@ -7,7 +7,8 @@ import PySimpleGUI as sg
 from datetime import datetime
 from collections import Counter
 
-from constants import STAR_FILLED, STAR_EMPTY, RATING_TAGS, NEGATIVE_TAGS, NEUTRAL_TAGS, POSITIVE_TAGS
+from constants import STAR_FILLED, STAR_EMPTY, RATING_TAGS, RATING_TAG_INDEX, NEGATIVE_TAGS, NEUTRAL_TAGS, POSITIVE_TAGS
+from utilities import parse_session_duration
 
 def format_rating(rating):
     """Format a rating as stars (1-5)"""
@@ -19,10 +20,20 @@ def format_rating(rating):
     except (ValueError, TypeError, AttributeError):
         return ""
 
+def get_rated_sessions(sessions):
+    """Return the sessions that carry a rating in the unified feedback format"""
+    return [s for s in sessions if 'feedback' in s and s['feedback'] and 'rating' in s['feedback'] and s['feedback']['rating'] is not None]
+
 def calculate_session_rating_average(sessions):
     """Calculate the average rating from sessions that have ratings"""
     # Look for ratings in the new unified feedback format
-    rated_sessions = [s for s in sessions if 'feedback' in s and s['feedback'] and 'rating' in s['feedback'] and s['feedback']['rating'] is not None]
+    return _weighted_rating_average(get_rated_sessions(sessions))
+
+def _weighted_rating_average(rated_sessions, tag_counter=None):
+    """Average the star ratings of rated sessions, weighted by session duration.
+
+    When a Counter is passed, the rating tags are counted into it in the same pass.
+    """
     if not rated_sessions:
         return None
     
@@ -31,17 +42,20 @@ def calculate_session_rating_average(sessions):
     weighted_sum = 0
     
     for session in rated_sessions:
+        if tag_counter is not None:
+            try:
+                tag_counter.update(session['feedback']['rating'].get('tags', []))
+            except (ValueError, TypeError, AttributeError):
+                pass
         try:
             # Get the star rating from the unified feedback structure
             stars = session['feedback']['rating'].get('stars', 0)
             
             # Get duration weight - newer sessions get higher weight
             if 'duration' in session:
-                duration_str = session['duration']
-                parts = duration_str.split(':')
-                if len(parts) == 3:
-                    h, m, s = map(int, parts)
-                    duration_mins = h * 60 + m + s/60
+                duration_seconds = parse_session_duration(session['duration'])
+                if duration_seconds is not None:
+                    duration_mins = duration_seconds / 60
                     weight = max(1, duration_mins / 30)  # At least weight of 1, otherwise scale by minutes
                     
                     weighted_sum += stars * weight
@@ -56,26 +70,16 @@ def calculate_session_rating_average(sessions):
 def get_session_rating_summary(sessions):
     """Get a summary of session ratings including most common tags"""
     # Look for ratings in the unified feedback format
-    rated_sessions = [s for s in sessions if 'feedback' in s and s['feedback'] and 'rating' in s['feedback'] and s['feedback']['rating'] is not None]
+    rated_sessions = get_rated_sessions(sessions)
     if not rated_sessions:
         return None
     
-    # Calculate average rating
-    average_rating = calculate_session_rating_average(sessions)
+    # Calculate average rating and count tag frequency in one pass over the rated sessions
+    tag_counter = Counter()
+    average_rating = _weighted_rating_average(rated_sessions, tag_counter)
     if average_rating is None:
         return None
     
-    # Collect all tags from session ratings
-    all_tags = []
-    for session in rated_sessions:
-        try:
-            tags = session['feedback']['rating'].get('tags', [])
-            all_tags.extend(tags)
-        except (ValueError, TypeError, AttributeError):
-            continue
-    
-    # Count tag frequency
-    tag_counter = Counter(all_tags)
     most_common_tags = [tag for tag, count in tag_counter.most_common(5)]  # Top 5 most common tags
     
     return {
@@ -105,39 +109,39 @@ def show_rating_popup(existing_rating=None, parent_window=None):
         [sg.Text("Select tags that describe your experience (optional):")],
         [sg.Frame("Negative", [
             [sg.Column([[
-                sg.Checkbox(tag, default=tag in existing_tags, key=f'-TAG-{RATING_TAGS.index(tag)}-', size=(11, 1)) 
+                sg.Checkbox(tag, default=tag in existing_tags, key=f'-TAG-{RATING_TAG_INDEX[tag]}-', size=(11, 1)) 
                 for tag in NEGATIVE_TAGS[:5]
             ]], vertical_alignment='top')],
             [sg.Column([[
-                sg.Checkbox(tag, default=tag in existing_tags, key=f'-TAG-{RATING_TAGS.index(tag)}-', size=(11, 1)) 
+                sg.Checkbox(tag, default=tag in existing_tags, key=f'-TAG-{RATING_TAG_INDEX[tag]}-', size=(11, 1)) 
                 for tag in NEGATIVE_TAGS[5:]
             ]], vertical_alignment='top')]
         ], font=('Arial', 9), relief=sg.RELIEF_SUNKEN, pad=((5, 5), (2, 2)))],
         [sg.Frame("Neutral", [
             [sg.Column([[
-                sg.Checkbox(tag, default=tag in existing_tags, key=f'-TAG-{RATING_TAGS.index(tag)}-', size=(11, 1)) 
+                sg.Checkbox(tag, default=tag in existing_tags, key=f'-TAG-{RATING_TAG_INDEX[tag]}-', size=(11, 1)) 
                 for tag in NEUTRAL_TAGS[:5]
             ]], vertical_alignment='top')],
             [sg.Column([[
-                sg.Checkbox(tag, default=tag in existing_tags, key=f'-TAG-{RATING_TAGS.index(tag)}-', size=(11, 1)) 
+                sg.Checkbox(tag, default=tag in existing_tags, key=f'-TAG-{RATING_TAG_INDEX[tag]}-', size=(11, 1)) 
                 for tag in NEUTRAL_TAGS[5:]
             ]], vertical_alignment='top')]
         ], font=('Arial', 9), relief=sg.RELIEF_SUNKEN, pad=((5, 5), (2, 2)))],
         [sg.Frame("Positive", [
             [sg.Column([[
-                sg.Checkbox(tag, default=tag in existing_tags, key=f'-TAG-{RATING_TAGS.index(tag)}-', size=(11, 1)) 
+                sg.Checkbox(tag, default=tag in existing_tags, key=f'-TAG-{RATING_TAG_INDEX[tag]}-', size=(11, 1)) 
                 for tag in POSITIVE_TAGS[:5]
             ]], vertical_alignment='top')],
             [sg.Column([[
-                sg.Checkbox(tag, default=tag in existing_tags, key=f'-TAG-{RATING_TAGS.index(tag)}-', size=(11, 1)) 
+                sg.Checkbox(tag, default=tag in existing_tags, key=f'-TAG-{RATING_TAG_INDEX[tag]}-', size=(11, 1)) 
                 for tag in POSITIVE_TAGS[5:10]
             ]], vertical_alignment='top')],
             [sg.Column([[
-                sg.Checkbox(tag, default=tag in existing_tags, key=f'-TAG-{RATING_TAGS.index(tag)}-', size=(11, 1)) 
+                sg.Checkbox(tag, default=tag in existing_tags, key=f'-TAG-{RATING_TAG_INDEX[tag]}-', size=(11, 1)) 
                 for tag in POSITIVE_TAGS[10:15]
             ]], vertical_alignment='top')],
             [sg.Column([[
-                sg.Checkbox(tag, default=tag in existing_tags, key=f'-TAG-{RATING_TAGS.index(tag)}-', size=(11, 1)) 
+                sg.Checkbox(tag, default=tag in existing_tags, key=f'-TAG-{RATING_TAG_INDEX[tag]}-', size=(11, 1)) 
                 for tag in POSITIVE_TAGS[15:]
             ]], vertical_alignment='top')]
         ], font=('Arial', 9), relief=sg.RELIEF_SUNKEN, pad=((5, 5), (2, 2)))],
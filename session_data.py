@@ -3,9 +3,10 @@ Session data operations and extraction functions.
 Handles session data retrieval, statistics calculation, and basic session operations.
 """
 
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
-from collections import defaultdict, Counter
-from utilities import format_timedelta_with_seconds
+from collections import Counter
+from utilities import format_timedelta_with_seconds, parse_session_duration, parse_session_timestamp
 
 
 def get_latest_session_end_time(sessions):
@@ -14,7 +15,7 @@ def get_latest_session_end_time(sessions):
     for session in sessions:
         if 'end' in session:
             try:
-                session_end = datetime.fromisoformat(session['end'])
+                session_end = parse_session_timestamp(session['end'])
                 if latest_end_time is None or session_end > latest_end_time:
                     latest_end_time = session_end
             except (ValueError, TypeError):
@@ -50,107 +51,124 @@ def calculate_session_statistics(all_sessions):
     if not all_sessions:
         return stats
     
-    # Track days with sessions
-    days_with_sessions = defaultdict(int)
+    # Collect session days and total seconds in one pass, so only one timedelta is built;
+    # the helpers are bound to locals as this loop runs over every session on each redraw
+    start_dates = []
+    add_start_date = start_dates.append
+    parse_duration = parse_session_duration
+    parse_timestamp = parse_session_timestamp
+    total_seconds = 0
     
     # Calculate total time across all sessions
     for session in all_sessions:
         try:
-            # Convert duration string to timedelta
+            # Convert duration string to seconds
             duration = session.get('duration', '00:00:00')
             if isinstance(duration, str):
-                parts = duration.split(':')
-                if len(parts) == 3:
-                    h, m, s = map(int, parts)
-                    duration_td = timedelta(hours=h, minutes=m, seconds=s)
-                    stats['total_time'] += duration_td
+                duration_seconds = parse_duration(duration)
+                if duration_seconds is not None:
+                    total_seconds += duration_seconds
             
             # Track session days
-            if 'start' in session:
+            start = session.get('start')
+            if start is not None:
                 try:
-                    start_date = datetime.fromisoformat(session['start']).date()
-                    days_with_sessions[start_date] += 1
+                    add_start_date(parse_timestamp(start).date())
                 except (ValueError, TypeError):
                     pass
         except Exception as e:
             print(f"Error processing session: {str(e)}")
             continue
     
+    # Count the sessions on each day in one go
+    days_with_sessions = Counter(start_dates)
+    
+    stats['total_time'] = timedelta(seconds=total_seconds)
+    
     # Calculate average session length
     if stats['total_count'] > 0:
         stats['avg_length'] = stats['total_time'] / stats['total_count']
     
-    # Find most active day
+    # Find most active day (the first one seen wins a tie)
     if days_with_sessions:
-        most_active = max(days_with_sessions.items(), key=lambda x: x[1])
+        day, count = days_with_sessions.most_common(1)[0]
         stats['most_active_day'] = {
-            'day': most_active[0],
-            'count': most_active[1]
+            'day': day,
+            'count': count
         }
     
     return stats
 
 
-def get_game_sessions(data, game_name):
-    """Get all sessions for a specific game"""
+def find_game_row(data, game_name):
+    """Get the row of the first game named game_name, or None if there is none"""
     for idx, game_data in data:
         if game_data[0] == game_name:
-            if len(game_data) > 7 and game_data[7]:
-                return game_data[7]
-            break
-    
+            return game_data
+    return None
+
+
+def get_row_sessions(game_data):
+    """Get the sessions stored in a game row"""
+    if game_data is not None and len(game_data) > 7 and game_data[7]:
+        return game_data[7]
+    return []
+
+
+def get_row_status_history(game_data):
+    """Get the status history stored in a game row"""
+    if game_data is not None and len(game_data) > 8 and game_data[8]:
+        return game_data[8]
     return []
 
 
+def get_game_sessions(data, game_name):
+    """Get all sessions for a specific game"""
+    return get_row_sessions(find_game_row(data, game_name))
+
+
 def get_status_history(data, game_name):
     """Get status history for a specific game"""
-    for idx, game_data in data:
-        if game_data[0] == game_name:
-            if len(game_data) > 8 and game_data[8]:
-                return game_data[8]
-            break
-    
-    return []
+    return get_row_status_history(find_game_row(data, game_name))
 
 
 def get_game_rating_comments(data, game_name):
     """Get all rating comments for a specific game (both game-level and session-level)"""
     comments = []
     
-    for idx, game_data in data:
-        if game_data[0] == game_name:
-            # Get game-level rating comment
-            if len(game_data) > 9 and game_data[9] and isinstance(game_data[9], dict):
-                game_rating = game_data[9]
-                if 'comment' in game_rating and game_rating['comment']:
-                    comments.append({
-                        'type': 'game',
-                        'stars': game_rating.get('stars', 0),
-                        'tags': game_rating.get('tags', []),
-                        'comment': game_rating['comment'],
-                        'timestamp': game_rating.get('timestamp', 'Unknown'),
-                        'auto_calculated': game_rating.get('auto_calculated', False)
-                    })
-            
-            # Get session-level rating comments from unified feedback structure
-            if len(game_data) > 7 and game_data[7]:
-                for i, session in enumerate(game_data[7]):
-                    if 'feedback' in session and session['feedback'] and 'rating' in session['feedback'] and session['feedback']['rating']:
-                        session_rating = session['feedback']['rating']
-                        # Check if there's a rating comment (note: comments are typically stored at the text level now)
-                        rating_comment = session_rating.get('comment', '')
-                        if rating_comment:
-                            comments.append({
-                                'type': 'session',
-                                'session_index': i + 1,
-                                'session_date': session.get('start', 'Unknown'),
-                                'duration': session.get('duration', '00:00:00'),
-                                'stars': session_rating.get('stars', 0),
-                                'tags': session_rating.get('tags', []),
-                                'comment': rating_comment,
-                                'timestamp': session_rating.get('timestamp', 'Unknown')
-                            })
-            break
+    game_data = find_game_row(data, game_name)
+    if game_data is not None:
+        # Get game-level rating comment
+        if len(game_data) > 9 and game_data[9] and isinstance(game_data[9], dict):
+            game_rating = game_data[9]
+            if 'comment' in game_rating and game_rating['comment']:
+                comments.append({
+                    'type': 'game',
+                    'stars': game_rating.get('stars', 0),
+                    'tags': game_rating.get('tags', []),
+                    'comment': game_rating['comment'],
+                    'timestamp': game_rating.get('timestamp', 'Unknown'),
+                    'auto_calculated': game_rating.get('auto_calculated', False)
+                })
+        
+        # Get session-level rating comments from unified feedback structure
+        if len(game_data) > 7 and game_data[7]:
+            for i, session in enumerate(game_data[7]):
+                if 'feedback' in session and session['feedback'] and 'rating' in session['feedback'] and session['feedback']['rating']:
+                    session_rating = session['feedback']['rating']
+                    # Check if there's a rating comment (note: comments are typically stored at the text level now)
+                    rating_comment = session_rating.get('comment', '')
+                    if rating_comment:
+                        comments.append({
+                            'type': 'session',
+                            'session_index': i + 1,
+                            'session_date': session.get('start', 'Unknown'),
+                            'duration': session.get('duration', '00:00:00'),
+                            'stars': session_rating.get('stars', 0),
+                            'tags': session_rating.get('tags', []),
+                            'comment': rating_comment,
+                            'timestamp': session_rating.get('timestamp', 'Unknown')
+                        })
     
     return comments
 
@@ -170,11 +188,9 @@ def add_manual_session_to_game(game_name, session, data_with_indices, data_stora
             # Update the game's total time
             try:
                 # Parse session duration
-                duration_str = session['duration']
-                parts = duration_str.split(':')
-                if len(parts) == 3:
-                    h, m, s = map(int, parts)
-                    session_duration = timedelta(hours=h, minutes=m, seconds=s)
+                duration_seconds = parse_session_duration(session['duration'])
+                if duration_seconds is not None:
+                    session_duration = timedelta(seconds=duration_seconds)
                     
                     # Get current time
                     current_time_str = game_data[3]
@@ -207,11 +223,14 @@ def add_manual_session_to_game(game_name, session, data_with_indices, data_stora
             
             # Update the full dataset when modifying filtered data
             if data_storage:
-                # Find and update the correct entry in data_storage
-                for i, (storage_idx, _) in enumerate(data_storage):
-                    if storage_idx == original_idx:
-                        data_storage[i] = (original_idx, game_data)
-                        break
+                # Find and update the correct entry in data_storage - usually it sits at its own index
+                if original_idx < len(data_storage) and data_storage[original_idx][0] == original_idx:
+                    data_storage[original_idx] = (original_idx, game_data)
+                else:
+                    for i, (storage_idx, _) in enumerate(data_storage):
+                        if storage_idx == original_idx:
+                            data_storage[i] = (original_idx, game_data)
+                            break
             
             return True
     
@@ -231,7 +250,7 @@ def find_most_active_period(sessions, window_months=1):
     for session in sessions:
         try:
             if 'start' in session:
-                session_date = datetime.fromisoformat(session['start']).date()
+                session_date = parse_session_timestamp(session['start']).date()
                 session_dates.append(session_date)
         except:
             continue
@@ -258,9 +277,8 @@ def find_most_active_period(sessions, window_months=1):
     while current_date >= earliest_date:
         start_date = current_date - timedelta(days=window_days)
         
-        # Count sessions in this window
-        sessions_in_window = sum(1 for date in session_dates 
-                               if start_date <= date <= current_date)
+        # Count sessions in this window; the dates are sorted, so binary search for its edges
+        sessions_in_window = bisect_right(session_dates, current_date) - bisect_left(session_dates, start_date)
         
         if sessions_in_window > max_sessions:
             max_sessions = sessions_in_window
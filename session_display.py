@@ -6,6 +6,7 @@ Handles formatting session data for UI display and presentation.
 import PySimpleGUI as sg
 from datetime import datetime
 from constants import STAR_FILLED, STAR_EMPTY
+from utilities import parse_session_timestamp
 from session_data import get_status_history
 
 
@@ -18,7 +19,7 @@ def format_session_for_display(sessions):
         """Get datetime object for sorting, defaulting to epoch for invalid dates"""
         if 'start' in session:
             try:
-                return datetime.fromisoformat(session['start'])
+                return parse_session_timestamp(session['start'])
             except (ValueError, TypeError):
                 pass
         return datetime.min  # Default to earliest possible date for invalid sessions
@@ -31,7 +32,7 @@ def format_session_for_display(sessions):
             start_time = "Unknown"
             if 'start' in session:
                 try:
-                    dt = datetime.fromisoformat(session['start'])
+                    dt = parse_session_timestamp(session['start'])
                     start_time = dt.strftime('%Y-%m-%d %H:%M')
                 except (ValueError, TypeError):
                     pass
@@ -48,8 +49,8 @@ def format_session_for_display(sessions):
             
             if 'end' in session:
                 try:
-                    start_dt = datetime.fromisoformat(session['start'])
-                    end_dt = datetime.fromisoformat(session['end'])
+                    start_dt = parse_session_timestamp(session['start'])
+                    end_dt = parse_session_timestamp(session['end'])
                     session_span = end_dt - start_dt
                     hours, remainder = divmod(session_span.total_seconds(), 3600)
                     minutes, seconds = divmod(remainder, 60)
@@ -99,7 +100,7 @@ def format_status_history_for_display(history):
             timestamp = "Unknown"
             if 'timestamp' in change:
                 try:
-                    dt = datetime.fromisoformat(change['timestamp'])
+                    dt = parse_session_timestamp(change['timestamp'])
                     timestamp = dt.strftime('%Y-%m-%d %H:%M:%S')
                 except (ValueError, TypeError):
                     pass
@@ -127,7 +128,7 @@ def format_rating_comments_for_display(comments):
             timestamp = "Unknown"
             if comment_data['timestamp'] != 'Unknown':
                 try:
-                    dt = datetime.fromisoformat(comment_data['timestamp'])
+                    dt = parse_session_timestamp(comment_data['timestamp'])
                     timestamp = dt.strftime('%Y-%m-%d %H:%M')
                 except (ValueError, TypeError):
                     pass
@@ -141,7 +142,7 @@ def format_rating_comments_for_display(comments):
                 session_date = "Unknown"
                 if comment_data['session_date'] != 'Unknown':
                     try:
-                        dt = datetime.fromisoformat(comment_data['session_date'])
+                        dt = parse_session_timestamp(comment_data['session_date'])
                         session_date = dt.strftime('%Y-%m-%d %H:%M')
                     except (ValueError, TypeError):
                         pass
@@ -192,7 +193,7 @@ def display_all_game_notes(game_name, sessions, data_with_indices, parent_window
                     timestamp = "Unknown time"
                     if 'timestamp' in game_rating:
                         try:
-                            timestamp_obj = datetime.fromisoformat(game_rating['timestamp'])
+                            timestamp_obj = parse_session_timestamp(game_rating['timestamp'])
                             timestamp = timestamp_obj.strftime('%Y-%m-%d %H:%M:%S')
                         except (ValueError, TypeError):
                             pass
@@ -243,7 +244,7 @@ def display_all_game_notes(game_name, sessions, data_with_indices, parent_window
                 timestamp_obj = datetime.min
                 if 'start' in session:
                     try:
-                        timestamp_obj = datetime.fromisoformat(session['start'])
+                        timestamp_obj = parse_session_timestamp(session['start'])
                         start_time = timestamp_obj.strftime('%Y-%m-%d %H:%M:%S')
                     except (ValueError, TypeError):
                         pass
@@ -283,7 +284,7 @@ def display_all_game_notes(game_name, sessions, data_with_indices, parent_window
         timestamp = "Unknown time"
         if 'timestamp' in status_change:
             try:
-                timestamp_obj = datetime.fromisoformat(status_change['timestamp'])
+                timestamp_obj = parse_session_timestamp(status_change['timestamp'])
                 timestamp = timestamp_obj.strftime('%Y-%m-%d %H:%M:%S')
             except (ValueError, TypeError):
                 pass
@@ -15,13 +15,16 @@ import matplotlib.pyplot as plt
 import numpy as np
 
 # Local imports
-from visualizations import isolate_matplotlib_env
+from visualizations import isolate_matplotlib_env, with_render_lock
 from session_data import (
     get_latest_session_end_time, 
     extract_all_sessions, 
     calculate_session_statistics, 
     get_game_sessions, 
     get_status_history, 
+    find_game_row, 
+    get_row_sessions, 
+    get_row_status_history, 
     add_manual_session_to_game, 
     find_most_active_period
 )
@@ -173,6 +176,7 @@ def migrate_all_game_sessions(data_with_indices):
 
 
 # Large visualization functions remain here due to their complexity
+@with_render_lock
 def create_session_heatmap(sessions, game_name=None, window_months=1, end_date=None):
     """Create a heatmap visualization showing gaming intensity and pauses with time-based windowing"""
     # Isolate matplotlib from the main application
@@ -431,6 +435,7 @@ def create_session_heatmap(sessions, game_name=None, window_months=1, end_date=N
     return buf
 
 
+@with_render_lock
 def create_github_style_contributions_heatmap(sessions, game_name=None):
     """Create a GitHub-style contributions heatmap showing gaming activity over time"""
     isolate_matplotlib_env()
@@ -6,7 +6,7 @@ Handles user interface elements for session management including popups and dial
 import time
 import PySimpleGUI as sg
 from datetime import datetime, timedelta, date
-from constants import STAR_FILLED, STAR_EMPTY, RATING_TAGS, NEGATIVE_TAGS, NEUTRAL_TAGS, POSITIVE_TAGS
+from constants import STAR_FILLED, STAR_EMPTY, RATING_TAGS, RATING_TAG_INDEX, NEGATIVE_TAGS, NEUTRAL_TAGS, POSITIVE_TAGS
 from utilities import format_timedelta_with_seconds, calculate_popup_center_location
 from session_data import get_latest_session_end_time
 from data_management import save_data
@@ -298,46 +298,46 @@ def show_session_feedback_popup(existing_feedback=None, parent_window=None):
             [sg.Frame("Negative", [
                 [sg.Column([[
                     sg.Checkbox(tag, default=tag in (existing_rating.get('tags', []) if existing_rating else []), 
-                               key=f'-TAG-{RATING_TAGS.index(tag)}-', size=(12, 1)) 
+                               key=f'-TAG-{RATING_TAG_INDEX[tag]}-', size=(12, 1)) 
                     for tag in NEGATIVE_TAGS[:5]
                 ]], vertical_alignment='top')],
                 [sg.Column([[
                     sg.Checkbox(tag, default=tag in (existing_rating.get('tags', []) if existing_rating else []), 
-                               key=f'-TAG-{RATING_TAGS.index(tag)}-', size=(12, 1)) 
+                               key=f'-TAG-{RATING_TAG_INDEX[tag]}-', size=(12, 1)) 
                     for tag in NEGATIVE_TAGS[5:]
                 ]], vertical_alignment='top')]
             ], font=('Arial', 9), relief=sg.RELIEF_SUNKEN, pad=((5, 5), (2, 2)))],
             [sg.Frame("Neutral", [
                 [sg.Column([[
                     sg.Checkbox(tag, default=tag in (existing_rating.get('tags', []) if existing_rating else []), 
-                               key=f'-TAG-{RATING_TAGS.index(tag)}-', size=(12, 1)) 
+                               key=f'-TAG-{RATING_TAG_INDEX[tag]}-', size=(12, 1)) 
                     for tag in NEUTRAL_TAGS[:5]
                 ]], vertical_alignment='top')],
                 [sg.Column([[
                     sg.Checkbox(tag, default=tag in (existing_rating.get('tags', []) if existing_rating else []), 
-                               key=f'-TAG-{RATING_TAGS.index(tag)}-', size=(12, 1)) 
+                               key=f'-TAG-{RATING_TAG_INDEX[tag]}-', size=(12, 1)) 
                     for tag in NEUTRAL_TAGS[5:]
                 ]], vertical_alignment='top')]
             ], font=('Arial', 9), relief=sg.RELIEF_SUNKEN, pad=((5, 5), (2, 2)))],
             [sg.Frame("Positive", [
                 [sg.Column([[
                     sg.Checkbox(tag, default=tag in (existing_rating.get('tags', []) if existing_rating else []), 
-                               key=f'-TAG-{RATING_TAGS.index(tag)}-', size=(12, 1)) 
+                               key=f'-TAG-{RATING_TAG_INDEX[tag]}-', size=(12, 1)) 
                     for tag in POSITIVE_TAGS[:5]
                 ]], vertical_alignment='top')],
                 [sg.Column([[
                     sg.Checkbox(tag, default=tag in (existing_rating.get('tags', []) if existing_rating else []), 
-                               key=f'-TAG-{RATING_TAGS.index(tag)}-', size=(12, 1)) 
+                               key=f'-TAG-{RATING_TAG_INDEX[tag]}-', size=(12, 1)) 
                     for tag in POSITIVE_TAGS[5:10]
                 ]], vertical_alignment='top')],
                 [sg.Column([[
                     sg.Checkbox(tag, default=tag in (existing_rating.get('tags', []) if existing_rating else []), 
-                               key=f'-TAG-{RATING_TAGS.index(tag)}-', size=(12, 1)) 
+                               key=f'-TAG-{RATING_TAG_INDEX[tag]}-', size=(12, 1)) 
                     for tag in POSITIVE_TAGS[10:15]
                 ]], vertical_alignment='top')],
                 [sg.Column([[
                     sg.Checkbox(tag, default=tag in (existing_rating.get('tags', []) if existing_rating else []), 
-                               key=f'-TAG-{RATING_TAGS.index(tag)}-', size=(12, 1)) 
+                               key=f'-TAG-{RATING_TAG_INDEX[tag]}-', size=(12, 1)) 
                     for tag in POSITIVE_TAGS[15:]
                 ]], vertical_alignment='top')]
             ], font=('Arial', 9), relief=sg.RELIEF_SUNKEN, pad=((5, 5), (2, 2)))]
@@ -449,43 +449,43 @@ def show_manual_session_popup(game_name, parent_window=None):
                     [sg.Column([
                         [sg.Frame("Negative", [
                             [sg.Column([[
-                                sg.Checkbox(tag, key=f'-TAG-{RATING_TAGS.index(tag)}-', size=(11, 1), font=('Arial', 8)) 
+                                sg.Checkbox(tag, key=f'-TAG-{RATING_TAG_INDEX[tag]}-', size=(11, 1), font=('Arial', 8)) 
                                 for tag in NEGATIVE_TAGS[:5]
                             ]], element_justification='left')],
                             [sg.Column([[
-                                sg.Checkbox(tag, key=f'-TAG-{RATING_TAGS.index(tag)}-', size=(11, 1), font=('Arial', 8)) 
+                                sg.Checkbox(tag, key=f'-TAG-{RATING_TAG_INDEX[tag]}-', size=(11, 1), font=('Arial', 8)) 
                                 for tag in NEGATIVE_TAGS[5:]
                             ]], element_justification='left')]
                         ], font=('Arial', 8), relief=sg.RELIEF_SUNKEN, pad=((2, 2), (2, 2)))],
                         [sg.Frame("Neutral", [
                             [sg.Column([[
-                                sg.Checkbox(tag, key=f'-TAG-{RATING_TAGS.index(tag)}-', size=(11, 1), font=('Arial', 8)) 
+                                sg.Checkbox(tag, key=f'-TAG-{RATING_TAG_INDEX[tag]}-', size=(11, 1), font=('Arial', 8)) 
                                 for tag in NEUTRAL_TAGS[:5]
                             ]], element_justification='left')],
                             [sg.Column([[
-                                sg.Checkbox(tag, key=f'-TAG-{RATING_TAGS.index(tag)}-', size=(11, 1), font=('Arial', 8)) 
+                                sg.Checkbox(tag, key=f'-TAG-{RATING_TAG_INDEX[tag]}-', size=(11, 1), font=('Arial', 8)) 
                                 for tag in NEUTRAL_TAGS[5:]
                             ]], element_justification='left')]
                         ], font=('Arial', 8), relief=sg.RELIEF_SUNKEN, pad=((2, 2), (2, 2)))],
                         [sg.Frame("Positive", [
                             [sg.Column([[
-                                sg.Checkbox(tag, key=f'-TAG-{RATING_TAGS.index(tag)}-', size=(11, 1), font=('Arial', 8)) 
+                                sg.Checkbox(tag, key=f'-TAG-{RATING_TAG_INDEX[tag]}-', size=(11, 1), font=('Arial', 8)) 
                                 for tag in POSITIVE_TAGS[:5]
                             ]], element_justification='left')],
                             [sg.Column([[
-                                sg.Checkbox(tag, key=f'-TAG-{RATING_TAGS.index(tag)}-', size=(11, 1), font=('Arial', 8)) 
+                                sg.Checkbox(tag, key=f'-TAG-{RATING_TAG_INDEX[tag]}-', size=(11, 1), font=('Arial', 8)) 
                                 for tag in POSITIVE_TAGS[5:10]
                             ]], element_justification='left')],
                             [sg.Column([[
-                                sg.Checkbox(tag, key=f'-TAG-{RATING_TAGS.index(tag)}-', size=(11, 1), font=('Arial', 8)) 
+                                sg.Checkbox(tag, key=f'-TAG-{RATING_TAG_INDEX[tag]}-', size=(11, 1), font=('Arial', 8)) 
                                 for tag in POSITIVE_TAGS[10:15]
                             ]], element_justification='left')],
                             [sg.Column([[
-                                sg.Checkbox(tag, key=f'-TAG-{RATING_TAGS.index(tag)}-', size=(11, 1), font=('Arial', 8)) 
+                                sg.Checkbox(tag, key=f'-TAG-{RATING_TAG_INDEX[tag]}-', size=(11, 1), font=('Arial', 8)) 
                                 for tag in POSITIVE_TAGS[15:20]
                             ]], element_justification='left')],
                             [sg.Column([[
-                                sg.Checkbox(tag, key=f'-TAG-{RATING_TAGS.index(tag)}-', size=(11, 1), font=('Arial', 8)) 
+                                sg.Checkbox(tag, key=f'-TAG-{RATING_TAG_INDEX[tag]}-', size=(11, 1), font=('Arial', 8)) 
                                 for tag in POSITIVE_TAGS[20:]
                             ]], element_justification='left')]
                         ], font=('Arial', 8), relief=sg.RELIEF_SUNKEN, pad=((2, 2), (2, 2)))]
@@ -9,9 +9,10 @@ import matplotlib.pyplot as plt
 import numpy as np
 from datetime import datetime, timedelta
 from collections import defaultdict, Counter
-from visualizations import isolate_matplotlib_env
+from visualizations import isolate_matplotlib_env, with_render_lock
 
 
+@with_render_lock
 def create_session_timeline_chart(sessions, game_name=None):
     """Create a timeline chart of gaming sessions"""
     isolate_matplotlib_env()
@@ -79,6 +80,7 @@ def create_session_timeline_chart(sessions, game_name=None):
     return buf
 
 
+@with_render_lock
 def create_session_distribution_chart(sessions, game_name=None, chart_type='line'):
     """Create a chart showing distribution of session lengths
     
@@ -280,6 +282,7 @@ def create_session_distribution_chart(sessions, game_name=None, chart_type='line
     return buf
 
 
+@with_render_lock
 def create_status_timeline_chart(history, game_name=None):
     """Create a timeline visualization of status changes"""
     isolate_matplotlib_env()
@@ -382,6 +385,7 @@ def calculate_gaming_streak(daily_activity, start_date, end_date):
     return max_streak
 
 
+@with_render_lock
 def create_comments_word_cloud_visualization(comments):
     """Create a word frequency visualization from rating comments"""
     isolate_matplotlib_env()
@@ -10,7 +10,7 @@ from datetime import datetime, timedelta
 from constants import STAR_FILLED, STAR_EMPTY, RATING_TAGS, COMPLETED_STYLE, IN_PROGRESS_STYLE, FUTURE_RELEASE_STYLE, DEFAULT_STYLE
 from ratings import format_rating, calculate_session_rating_average, show_rating_popup
 from utilities import calculate_pixel_width, get_game_table_row_colors, format_timedelta_with_seconds, format_timedelta
-from game_statistics import count_total_completed, count_total_entries, calculate_completion_percentage, calculate_total_time
+from game_statistics import count_library_totals, calculate_completion_percentage, calculate_total_time
 
 def get_discord_menu_text():
     """Get the current Discord menu text based on enabled status"""
@@ -209,33 +209,100 @@ def show_game_actions_dialog(row_index, data_with_indices, parent_window=None):
     
     return action
 
+# Rows pushed into the games table at a time; more are appended as the user scrolls towards the end
+TABLE_BATCH_ROWS = 200
+
+def get_table_item_values(table, row_index, display_row):
+    """Get the Treeview values for a display row, with the row number the Table shows in front"""
+    if table.DisplayRowNumbers:
+        return [row_index + table.StartingRowNumber] + display_row
+    return display_row
+
+def load_more_table_rows(table):
+    """Append the next batch of not-yet-shown rows to the games table"""
+    table.lazy_load_pending = False
+    start = len(table.Values)
+    batch = table.lazy_data[start:start + TABLE_BATCH_ROWS]
+    if not batch:
+        return
+
+    # Insert the rows the same way Table.update does: iid is position + 1, tag is position
+    tree = table.Widget
+    for offset, ((_, row), (_, text_color, background_color)) in enumerate(zip(batch, get_game_table_row_colors(batch))):
+        row_index = start + offset
+        display_row = get_display_row_with_rating(row)
+        item_id = tree.insert('', 'end', iid=row_index + 1, values=get_table_item_values(table, row_index, display_row), tag=row_index)
+        tree.tag_configure(row_index, background=background_color, foreground=text_color)
+        table.tree_ids.append(item_id)
+        table.Values.append(display_row)
+
+def set_table_data(table, data_with_indices):
+    """Remember the full data behind the games table and load the rest of it on demand while scrolling"""
+    table.lazy_data = data_with_indices
+    table.lazy_load_pending = False
+    if table.vsb is None:
+        # No scrollbar to follow, so show everything
+        while len(table.Values) < len(data_with_indices):
+            load_more_table_rows(table)
+        return
+
+    if not getattr(table, 'lazy_scroll_hooked', False):
+        def on_table_scroll(first, last):
+            table.vsb.set(first, last)
+            # Near the bottom of what's loaded - append the next batch once Tk is idle
+            if float(last) >= 0.9 and len(table.Values) < len(table.lazy_data) and not table.lazy_load_pending:
+                table.lazy_load_pending = True
+                table.Widget.after_idle(load_more_table_rows, table)
+
+        table.Widget.configure(yscrollcommand=on_table_scroll)
+        table.lazy_scroll_hooked = True
+
 def update_table_display(data_with_indices, window):
     """Update the table display with the current data"""
+    table = window['-TABLE-']
+    # Only the first batch is formatted and inserted now; the rest follows as the table is scrolled
+    first_rows = data_with_indices[:TABLE_BATCH_ROWS]
+
     # Get formatted display values
-    display_values = [get_display_row_with_rating(row[1]) for row in data_with_indices]
+    display_values = [get_display_row_with_rating(row[1]) for row in first_rows]
     
     # Get enhanced row colors
-    row_colors = get_game_table_row_colors(data_with_indices)
+    row_colors = get_game_table_row_colors(first_rows)
     
     # Update the table with new data
-    window['-TABLE-'].update(
+    table.update(
         values=display_values,
         row_colors=row_colors
     )
+    set_table_data(table, data_with_indices)
     
     return display_values
 
-def get_table_column_widths(data_with_indices):
+def update_table_row(data_with_indices, row_index, window):
+    """Update a single row of the table in place after that game was edited"""
+    table = window['-TABLE-']
+    if row_index >= len(table.Values):
+        # Not loaded yet - it will be formatted from the current data when it is
+        return None
+    display_row = get_display_row_with_rating(data_with_indices[row_index][1])
+    table.Values[row_index] = display_row
+
+    # Rows are inserted in order and tagged with their position, so patch the item and its tag colors directly
+    tree = table.Widget
+    tree.item(row_index + 1, values=get_table_item_values(table, row_index, display_row))
+    _, text_color, background_color = get_game_table_row_colors([data_with_indices[row_index]])[0]
+    tree.tag_configure(row_index, background=background_color, foreground=text_color)
+
+    return display_row
+
+def get_table_column_widths(data_with_indices, table_data=None):
     """Calculate optimal column widths for the table"""
     # Define the headings
     headings = ["Name", "Release", "Platform", "Time", "Status", "Owned", "Last Played", "Rating"]
     
-    # Format table data for display
-    table_data = []
-    for t_row in data_with_indices:
-        row = t_row[1]
-        display_row = get_display_row_with_rating(row)
-        table_data.append(display_row)
+    # Format table data for display, unless the caller already has it
+    if table_data is None:
+        table_data = [get_display_row_with_rating(t_row[1]) for t_row in data_with_indices]
     
     # Find the longest string in each column
     max_strings = [max((str(cell) for cell in col), key=len) for col in zip(*([headings] + table_data))]
@@ -255,9 +322,6 @@ def get_table_column_widths(data_with_indices):
 
 def create_main_layout(data_with_indices):
     """Create the main application layout with tabs"""
-    # Get column widths and headings
-    col_widths, headings = get_table_column_widths(data_with_indices)
-    
     # Format the Time column values and create table data
     table_data = []
     for t_row in data_with_indices:
@@ -287,13 +351,16 @@ def create_main_layout(data_with_indices):
         display_row = get_display_row_with_rating(row)
         table_data.append(display_row)
     
-    # Get enhanced row colors
-    row_colors = get_game_table_row_colors(data_with_indices)
+    # Column widths come from the rows just formatted rather than formatting every row again
+    col_widths, headings = get_table_column_widths(data_with_indices, table_data)
+    
+    # Get enhanced row colors; only the first batch of rows is shown up front
+    row_colors = get_game_table_row_colors(data_with_indices[:TABLE_BATCH_ROWS])
 
     # Tab 1 - Data Table
     tab1_layout = [
         [sg.InputText(key='-SEARCH-', size=(20, 1)), sg.Button('Search'), sg.Button('Reset'), sg.Button('Save'), sg.Button('Add Entry')],
-        [sg.Table(values=table_data, headings=headings, auto_size_columns=False, display_row_numbers=True,
+        [sg.Table(values=table_data[:TABLE_BATCH_ROWS], headings=headings, auto_size_columns=False, display_row_numbers=True,
                   justification='left', num_rows=min(25, len(data_with_indices)), key='-TABLE-',
                   enable_events=True, expand_x=True, expand_y=True, col_widths=col_widths,
                   enable_click_events=True, vertical_scroll_only=True,
@@ -302,18 +369,20 @@ def create_main_layout(data_with_indices):
     ]
 
     # Tab 2 - Summary with visualizations (scrollable)
+    total_games, completed_games = count_library_totals(data_with_indices)
     summary_content = [
         [sg.Text("Games Summary Dashboard", font=("Helvetica", 16, "bold"), justification='center', expand_x=True)],
         [sg.HorizontalSeparator()],
         
         # Refresh button at the top for easy access
-        [sg.Button("Refresh Charts", key='-REFRESH-CHARTS-', pad=(0, (10, 20)))],
+        [sg.Button("Refresh Charts", key='-REFRESH-CHARTS-', pad=(0, (10, 20))),
+         sg.Text("", key='-CHARTS-STATUS-', font=('Helvetica', 9, 'italic'), size=(20, 1))],
         
         # Key metrics row
         [sg.Frame('Key Metrics', [
-            [sg.Text(f"Total Games: {count_total_entries(data_with_indices)}", font=('Helvetica', 12), pad=(10, 5), size=(20, 1)),
-             sg.Text(f"Completed: {count_total_completed(data_with_indices)}", font=('Helvetica', 12), pad=(10, 5), size=(15, 1)),
-             sg.Text(f"Completion: {calculate_completion_percentage(count_total_completed(data_with_indices), count_total_entries(data_with_indices)):.1f}%", font=('Helvetica', 12), pad=(10, 5), size=(15, 1))],
+            [sg.Text(f"Total Games: {total_games}", font=('Helvetica', 12), pad=(10, 5), size=(20, 1)),
+             sg.Text(f"Completed: {completed_games}", font=('Helvetica', 12), pad=(10, 5), size=(15, 1)),
+             sg.Text(f"Completion: {calculate_completion_percentage(completed_games, total_games):.1f}%", font=('Helvetica', 12), pad=(10, 5), size=(15, 1))],
             [sg.Text(f"Total Play Time: {calculate_total_time(data_with_indices)}", font=('Helvetica', 12), pad=(10, 5), key='-TOTAL-TIME-')]
         ], font=('Helvetica', 12), expand_x=True)],
         
@@ -347,6 +416,7 @@ def create_main_layout(data_with_indices):
     # Wrap the content in a scrollable column with proper bottom padding
     tab2_layout = [
         [sg.Column(summary_content, 
+                   key='-SUMMARY-COLUMN-',
                    scrollable=True, 
                    vertical_scroll_only=True,
                    size=(None, 700),  # Fixed height of 700 pixels
@@ -497,6 +567,7 @@ def create_main_layout(data_with_indices):
     # Wrap the content in a scrollable column with proper bottom padding
     tab3_layout = [
         [sg.Column(statistics_content, 
+                   key='-STATS-COLUMN-',
                    scrollable=True, 
                    vertical_scroll_only=True,
                    size=(None, 700),  # Fixed height of 700 pixels
@@ -5,6 +5,7 @@ Contains various helper functions for formatting, calculations, and data process
 
 import tkinter as tk
 from datetime import timedelta, datetime
+from functools import lru_cache
 
 from constants import STAR_FILLED, STAR_EMPTY, COMPLETED_STYLE, IN_PROGRESS_STYLE, FUTURE_RELEASE_STYLE, DEFAULT_STYLE
 
@@ -24,6 +25,28 @@ def format_timedelta(td):
     hours, minutes = divmod(total_minutes, 60)
     return f'{hours:02}:{minutes:02}'
 
+@lru_cache(maxsize=4096)
+def parse_session_duration(duration_str):
+    """Parse an 'H:MM:SS' session duration into seconds, or None for any other number of parts.
+
+    Cached because the statistics and ratings parse the same session durations on every redraw.
+    Raises ValueError for non-numeric parts.
+    """
+    parts = duration_str.split(':')
+    if len(parts) != 3:
+        return None
+    h, m, s = map(int, parts)
+    return h * 3600 + m * 60 + s
+
+@lru_cache(maxsize=65536)
+def parse_session_timestamp(timestamp_str):
+    """Parse an ISO session or status-change timestamp into a datetime.
+
+    Cached because every statistics view, chart and table parses the same start and end times again.
+    Raises ValueError or TypeError like datetime.fromisoformat.
+    """
+    return datetime.fromisoformat(timestamp_str)
+
 def format_timedelta_with_seconds(td):
     """Format timedelta as HH:MM:SS"""
     if td is None:
@@ -58,10 +81,26 @@ def calculate_pixel_width(text, font=('Helvetica', 10)):
     root.destroy()
     return width
 
+def sort_by_column(data, column_index, sort_key, reverse=False):
+    """Sort (index, row) data by one column: pull the column out once, key each distinct value once, then sort row positions"""
+    key_cache = {}
+    keys = []
+    for item in data:
+        value = item[1][column_index]
+        try:
+            key = key_cache[value]
+        except KeyError:
+            key = key_cache[value] = sort_key(value)
+        except TypeError:
+            # Unhashable cells (lists, dicts) can't be cached
+            key = sort_key(value)
+        keys.append(key)
+    order = sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
+    return [data[i] for i in order]
+
 def safe_sort_by_date(data, column_index, reverse=False):
     """Safely sort data by date, handling missing and invalid dates"""
-    def sort_key(item):
-        value = item[1][column_index]
+    def sort_key(value):
         if not value or value == '-':
             # Sort missing dates to the end by default
             return (1, '9999-12-31') if not reverse else (1, '0001-01-01')
@@ -74,7 +113,7 @@ def safe_sort_by_date(data, column_index, reverse=False):
             # If not a valid date, sort as string
             return (2, value)
             
-    return sorted(data, key=sort_key, reverse=reverse)
+    return sort_by_column(data, column_index, sort_key, reverse=reverse)
 
 def safe_sort_by_time(data, column_index, reverse=False):
     """Safely sort data by time, handling missing and invalid times"""
@@ -95,7 +134,7 @@ def safe_sort_by_time(data, column_index, reverse=False):
         except (ValueError, AttributeError):
             return 0
             
-    return sorted(data, key=lambda x: time_to_seconds(x[1][column_index]), reverse=reverse)
+    return sort_by_column(data, column_index, time_to_seconds, reverse=reverse)
 
 def get_session_row_colors(display_data):
     """Generate row colors for sessions based on their feedback and ratings"""
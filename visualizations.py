@@ -5,14 +5,44 @@ Handles all chart and graph generation including matplotlib integration.
 
 import os
 import io
-import tempfile
+import json
+import time
+import hashlib
+import threading
+from functools import wraps
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import numpy as np
 from datetime import timedelta, datetime
 from collections import defaultdict
 
 from utilities import format_timedelta_with_seconds
+from config import get_config_dir
+from constants import VERSION
+
+# Rendered Summary charts are kept on disk between runs, keyed by a hash of the data they show
+CHART_CACHE_MAX_AGE_DAYS = 7
+# Part of every cache key along with the app version - bump it when chart drawing or styling changes
+CHART_CACHE_VERSION = 1
+CHART_NAMES = ('pie_chart', 'year_chart', 'playtime_chart', 'rating_chart')
+# Row columns each Summary chart is drawn from, so an edit only re-renders the charts it affects.
+# Counting charts don't depend on row order; the playtime chart lists games, so it does.
+CHART_INPUTS = {
+    'pie_chart': ((4,), False),          # status
+    'year_chart': ((1, 4), False),       # release date, status
+    'playtime_chart': ((0, 3), True),    # name, time
+    'rating_chart': ((9,), False),       # rating stars
+}
+
+# pyplot keeps global state (rcParams, backend, open figures), so only one thread may render with it at a time
+RENDER_LOCK = threading.RLock()
+
+# One Figure per Summary chart, cleared and redrawn on each render instead of created anew.
+# They are built outside pyplot, so plt.close('all') leaves them alone, but drawing them still
+# reads rcParams - render_summary_charts holds RENDER_LOCK so no isolate_matplotlib_env runs meanwhile.
+_summary_figures = {}
 
 def isolate_matplotlib_env():
     """
@@ -33,6 +63,25 @@ def isolate_matplotlib_env():
     # Make sure any existing figures are closed
     plt.close('all')
 
+def with_render_lock(func):
+    """Run a pyplot chart builder while holding RENDER_LOCK, so no other thread resets pyplot under it"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with RENDER_LOCK:
+            return func(*args, **kwargs)
+    return wrapper
+
+def get_summary_figure(name, figsize):
+    """Get the reusable Figure for a Summary chart, cleared, with a fresh Axes to draw on"""
+    fig = _summary_figures.get(name)
+    if fig is None:
+        fig = Figure(figsize=figsize, dpi=100)
+        FigureCanvasAgg(fig)
+        _summary_figures[name] = fig
+    else:
+        fig.clear()
+    return fig, fig.add_subplot()
+
 def draw_figure(canvas, figure):
     """Draw a matplotlib figure on a PySimpleGUI canvas"""
     figure_canvas_agg = FigureCanvasTkAgg(figure, canvas)
@@ -42,9 +91,6 @@ def draw_figure(canvas, figure):
 
 def create_status_pie_chart(data):
     """Create a pie chart showing game status distribution"""
-    # Isolate matplotlib from the main application
-    isolate_matplotlib_env()
-    
     status_counts = {'Completed': 0, 'In progress': 0, 'Pending': 0}
     
     for entry in data:
@@ -73,7 +119,7 @@ def create_status_pie_chart(data):
             status_counts['Pending'] += 1
     
     # Create figure with fixed dimensions for consistency
-    fig, ax = plt.subplots(figsize=(4, 3.5))
+    fig, ax = get_summary_figure('pie_chart', (4, 3.5))
     
     # Define colors for each status - using more vibrant colors for better visibility
     colors = ['#5cb85c',  # Vibrant green for Completed
@@ -96,21 +142,17 @@ def create_status_pie_chart(data):
     
     # Equal aspect ratio ensures that pie is drawn as a circle
     ax.axis('equal')
-    plt.title('Game Status Distribution', fontsize=12)  # Fixed font size for title
+    ax.set_title('Game Status Distribution', fontsize=12)  # Fixed font size for title
     
     # Save to a bytes buffer
     buf = io.BytesIO()
-    fig.savefig(buf, format='png', bbox_inches='tight')
+    fig.savefig(buf, format='png', dpi=100, bbox_inches='tight')
     buf.seek(0)
-    plt.close(fig)
     
     return buf
 
 def create_year_bar_chart(data):
     """Create a bar chart showing games by release year"""
-    # Isolate matplotlib from the main application
-    isolate_matplotlib_env()
-    
     year_data = defaultdict(lambda: {'Completed': 0, 'In progress': 0, 'Pending': 0})
     
     for entry in data:
@@ -163,7 +205,7 @@ def create_year_bar_chart(data):
             pending.append(year_data[year]['Pending'])
     
     # Create figure with fixed dimensions
-    fig, ax = plt.subplots(figsize=(7.5, 3))
+    fig, ax = get_summary_figure('year_chart', (7.5, 3))
     
     # Set position of bar on X axis
     x = np.arange(len(years))
@@ -183,21 +225,17 @@ def create_year_bar_chart(data):
     ax.tick_params(axis='both', which='major', labelsize=8)
     ax.legend(fontsize=8)
     
-    plt.tight_layout()
+    fig.tight_layout()
     
     # Save to a bytes buffer
     buf = io.BytesIO()
-    fig.savefig(buf, format='png', bbox_inches='tight')
+    fig.savefig(buf, format='png', dpi=100, bbox_inches='tight')
     buf.seek(0)
-    plt.close(fig)
     
     return buf
 
 def create_playtime_distribution(data):
     """Create a chart showing playtime distribution among top games"""
-    # Isolate matplotlib from the main application
-    isolate_matplotlib_env()
-    
     # Collect playtime data
     playtime_data = []
     
@@ -246,7 +284,7 @@ def create_playtime_distribution(data):
     top_games = playtime_data[:10]
     
     # Create figure with fixed dimensions
-    fig, ax = plt.subplots(figsize=(5, 4))
+    fig, ax = get_summary_figure('playtime_chart', (5, 4))
     
     if top_games:
         # Extract data for plotting - use shorter names
@@ -278,21 +316,17 @@ def create_playtime_distribution(data):
                 ha='center', va='center', fontsize=10)
         ax.set_title('Top Games by Playtime', fontsize=12)
     
-    plt.tight_layout()
+    fig.tight_layout()
     
     # Save to a bytes buffer
     buf = io.BytesIO()
-    fig.savefig(buf, format='png', bbox_inches='tight')
+    fig.savefig(buf, format='png', dpi=100, bbox_inches='tight')
     buf.seek(0)
-    plt.close(fig)
     
     return buf
 
 def create_rating_distribution_chart(data):
     """Create a chart showing distribution of game ratings"""
-    # Isolate matplotlib from the main application
-    isolate_matplotlib_env()
-    
     # Collect rating data
     rating_data = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
     rated_games = 0
@@ -319,7 +353,7 @@ def create_rating_distribution_chart(data):
             continue  # Skip invalid entries
     
     # Create figure with fixed dimensions
-    fig, ax = plt.subplots(figsize=(5, 4))
+    fig, ax = get_summary_figure('rating_chart', (5, 4))
     
     if rated_games > 0:
         # Extract data for plotting
@@ -353,62 +387,98 @@ def create_rating_distribution_chart(data):
         ax.set_title("Game Ratings Distribution", fontsize=12)
     
     # Adjust layout to provide more space for the average rating text
-    plt.subplots_adjust(bottom=0.25)  # Add more bottom margin
-    plt.tight_layout()
+    fig.subplots_adjust(bottom=0.25)  # Add more bottom margin
+    fig.tight_layout()
     
     # Save to a buffer
     buf = io.BytesIO()
-    fig.savefig(buf, format='png', bbox_inches='tight')
+    fig.savefig(buf, format='png', dpi=100, bbox_inches='tight')
     buf.seek(0)
-    plt.close(fig)
     
     return buf
 
+def get_chart_cache_dir():
+    """Get the directory used to persist rendered Summary charts"""
+    cache_dir = os.path.join(get_config_dir(), 'chartcache')
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+def get_chart_hash(data_with_indices, chart_name):
+    """Hash only the columns the given Summary chart is drawn from, plus the app and chart cache versions"""
+    columns, ordered = CHART_INPUTS[chart_name]
+    projection = []
+    for entry in data_with_indices:
+        row = entry[1] if isinstance(entry, tuple) and len(entry) > 1 else entry
+        cells = []
+        for col in columns:
+            cell = row[col] if len(row) > col else None
+            if col == 9:
+                cell = cell.get('stars') if isinstance(cell, dict) else None
+            cells.append(str(cell))
+        projection.append(cells)
+    if not ordered:
+        projection.sort()
+    payload = json.dumps(projection, ensure_ascii=False).encode('utf-8')
+    # Charts drawn by another release may look different, so they must not be reused
+    hasher = hashlib.blake2b(f'{VERSION}:{CHART_CACHE_VERSION}:'.encode('utf-8'), digest_size=16)
+    hasher.update(payload)
+    return hasher.hexdigest()
+
+def evict_stale_chart_cache(cache_dir, max_age_days=CHART_CACHE_MAX_AGE_DAYS):
+    """Delete cached chart files that haven't been used for max_age_days"""
+    cutoff = time.time() - max_age_days * 86400
+    try:
+        for entry in os.scandir(cache_dir):
+            if entry.is_file() and entry.name.endswith('.png') and entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+    except OSError as e:
+        print(f"Warning: Could not clean chart cache: {str(e)}")
+
 def update_summary_charts(data_with_indices):
     """Update all charts in the Summary tab"""
     try:
-        # Save the current matplotlib settings to restore later
-        original_backend = plt.get_backend()
-        
-        # Create temporary files for each chart
-        temp_dir = tempfile.gettempdir()
-        pie_chart_file = os.path.join(temp_dir, 'pie_chart_temp.png')
-        year_chart_file = os.path.join(temp_dir, 'year_chart_temp.png')
-        playtime_chart_file = os.path.join(temp_dir, 'playtime_chart_temp.png')
-        rating_chart_file = os.path.join(temp_dir, 'rating_chart_temp.png')
-        
-        # Use the create_X functions but save to files
-        pie_data = create_status_pie_chart(data_with_indices)
-        with open(pie_chart_file, 'wb') as f:
-            f.write(pie_data.getvalue())
-            
-        year_data = create_year_bar_chart(data_with_indices)
-        with open(year_chart_file, 'wb') as f:
-            f.write(year_data.getvalue())
-            
-        playtime_data = create_playtime_distribution(data_with_indices)
-        with open(playtime_chart_file, 'wb') as f:
-            f.write(playtime_data.getvalue())
-            
-        rating_data = create_rating_distribution_chart(data_with_indices)
-        with open(rating_chart_file, 'wb') as f:
-            f.write(rating_data.getvalue())
+        # Reuse each chart from the disk cache if its input columns were already rendered
+        cache_dir = get_chart_cache_dir()
+        chart_files = {name: os.path.join(cache_dir, f'{get_chart_hash(data_with_indices, name)}_{name}.png')
+                       for name in CHART_NAMES}
+        missing = {}
+        for name, path in chart_files.items():
+            if os.path.exists(path):
+                os.utime(path)  # Mark as recently used so it isn't evicted
+            else:
+                missing[name] = path
         
-        # Close all matplotlib figures and reset to avoid affecting PySimpleGUI
-        plt.close('all')
-        plt.rcdefaults()
-        try:
-            plt.switch_backend(original_backend)
-        except:
-            pass
+        images = {}
+        if missing:
+            images = render_summary_charts(data_with_indices, missing)
+            evict_stale_chart_cache(cache_dir)
         
-        return {
-            'pie_chart': pie_chart_file,
-            'year_chart': year_chart_file,
-            'playtime_chart': playtime_chart_file,
-            'rating_chart': rating_chart_file
-        }
+        # Hand the PNG bytes to the UI so Tk decodes them without opening the files again
+        for name, path in chart_files.items():
+            if name not in images:
+                with open(path, 'rb') as f:
+                    images[name] = f.read()
+        return images
             
     except Exception as e:
         print(f"Error updating charts: {str(e)}")
-        return None 
\ No newline at end of file
+        return None
+
+def render_summary_charts(data_with_indices, chart_files):
+    """Render the given Summary charts to their files and return their PNG bytes"""
+    chart_creators = {
+        'pie_chart': create_status_pie_chart,
+        'year_chart': create_year_bar_chart,
+        'playtime_chart': create_playtime_distribution,
+        'rating_chart': create_rating_distribution_chart,
+    }
+    # Use the create_X functions but save to files
+    images = {}
+    with RENDER_LOCK:
+        for name, path in chart_files.items():
+            images[name] = chart_creators[name](data_with_indices).getvalue()
+    for name, path in chart_files.items():
+        with open(path, 'wb') as f:
+            f.write(images[name])
+    
+    return images